@@ -1,12 +1,12 @@
 from src.config import DatabaseConfig
-from src.database import GrailDatabase
-import psycopg2
+from src.db_pool import get_pool
 config = DatabaseConfig()
-params = config.get_connection_params()
-conn = psycopg2.connect(**params)
-cursor = conn.cursor()
-cursor.execute('DROP TABLE IF EXISTS grail_files CASCADE')
-conn.commit()
-cursor.close()
-conn.close()
-print('Table dropped successfully!')
\ No newline at end of file
+pool = get_pool(config)
+conn = pool.getconn()
+try:
+    # The connection context manager commits, or rolls back on error
+    with conn, conn.cursor() as cursor:
+        cursor.execute('DROP TABLE IF EXISTS grail_files CASCADE')
+finally:
+    pool.putconn(conn)
+print('Table dropped successfully!')
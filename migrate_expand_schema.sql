@@ -272,7 +272,9 @@ RAISE NOTICE 'Data backfill completed';
 
 RAISE NOTICE 'Creating indexes on new columns...';
 
-CREATE INDEX IF NOT EXISTS idx_should_trade ON grail_files(should_trade);
+-- Partial index for the "actionable trades" query; a full index on a boolean is rarely used
+DROP INDEX IF EXISTS idx_should_trade;
+CREATE INDEX IF NOT EXISTS idx_should_trade_ingested ON grail_files(ingested_at DESC) WHERE should_trade IS TRUE;
 CREATE INDEX IF NOT EXISTS idx_trade_action ON grail_files(trade_action);
 CREATE INDEX IF NOT EXISTS idx_trade_style ON grail_files(trade_style);
 CREATE INDEX IF NOT EXISTS idx_status ON grail_files(status);
@@ -2,15 +2,26 @@
 Command-line interface for save-grail-json.
 """
 
+import itertools
+import os
 import sys
 from pathlib import Path
-from typing import List
+from typing import Iterable, Iterator, List
 import click
 
 from src import __version__
 from src.config import DatabaseConfig, ConfigError
 from src.database import GrailDatabase, DatabaseError
-from src.ingestion import ingest_json_file, IngestionError
+from src.ingestion import ingest_json_files, IngestionError
+
+
+# Number of ingested files written to the database per bulk insert
+BATCH_SIZE = 1000
+
+# Loads of at least this many files that would also grow the table by more
+# than AUTO_BULK_RATIO switch to bulk mode without --bulk-load
+AUTO_BULK_MIN_FILES = 1000
+AUTO_BULK_RATIO = 0.1
 
 
 @click.command()
@@ -29,8 +40,31 @@ from src.ingestion import ingest_json_file, IngestionError
     '--database',
     help='Database name (overrides config file setting)'
 )
+@click.option(
+    '--input-dir',
+    type=click.Path(exists=True, file_okay=False),
+    help='Ingest every .json file in this directory (read while ingesting)'
+)
+@click.option(
+    '--workers',
+    type=click.IntRange(min=1),
+    help='Number of worker processes for parsing files (default: CPU count)'
+)
+@click.option(
+    '--bulk-load',
+    is_flag=True,
+    help='Drop secondary indexes during the load and rebuild them afterwards'
+)
 @click.version_option(version=__version__, prog_name='save-grail-json')
-def main(files: tuple, tui: bool, config: str, database: str):
+def main(
+    files: tuple,
+    tui: bool,
+    config: str,
+    database: str,
+    input_dir: str,
+    workers: int,
+    bulk_load: bool
+):
     """
     Save grail JSON files to PostgreSQL database for later review and analysis.
 
@@ -38,6 +72,8 @@ def main(files: tuple, tui: bool, config: str, database: str):
     Examples:
         save-grail-json file1.json file2.json
         save-grail-json data/*.json
+        save-grail-json --input-dir data
+        save-grail-json --bulk-load --input-dir data
         save-grail-json --tui
         save-grail-json --config /path/to/config.toml file.json
     """
@@ -47,7 +83,7 @@ def main(files: tuple, tui: bool, config: str, database: str):
         return
 
     # CLI mode requires files
-    if not files:
+    if not files and not input_dir:
         click.echo("Error: No files specified. Use --tui for interactive mode or provide file paths.")
         click.echo("Run 'save-grail-json --help' for usage information.")
         sys.exit(1)
@@ -59,109 +95,122 @@ def main(files: tuple, tui: bool, config: str, database: str):
         click.echo(f"Configuration Error: {e}", err=True)
         sys.exit(1)
 
-    # Process files
-    process_files(list(files), db_config, database)
+    # Process files; a directory is scanned lazily as ingestion proceeds
+    file_paths: Iterable[str] = list(files)
+    if input_dir:
+        file_paths = itertools.chain(file_paths, scan_json_files(input_dir))
+
+    process_files(file_paths, db_config, database, workers, bulk_load)
+
+
+def scan_json_files(directory: str) -> Iterator[str]:
+    """
+    Yield the paths of JSON files in a directory as they are discovered.
+
+    Args:
+        directory: Directory to scan (not recursive)
+    """
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.name.lower().endswith('.json') and entry.is_file():
+                yield entry.path
 
 
-def process_files(file_paths: List[str], db_config: DatabaseConfig, database_name: str = None):
+def process_files(
+    file_paths: Iterable[str],
+    db_config: DatabaseConfig,
+    database_name: str = None,
+    workers: int = None,
+    bulk_load: bool = False
+):
     """
     Process and ingest JSON files.
 
+    Files are parsed in worker processes while the main process writes
+    completed batches to the database.
+
     Args:
-        file_paths: List of file paths to process
+        file_paths: File paths to process (a list, or any iterable to stream)
         db_config: Database configuration
         database_name: Optional database name override
+        workers: Number of parser processes (defaults to the CPU count)
+        bulk_load: Rebuild secondary indexes once after the load instead of
+            maintaining them on every insert. Large loads of a known number
+            of files relative to the table size use this automatically.
     """
-    total_files = len(file_paths)
     inserted_count = 0
     updated_count = 0
     duplicate_count = 0
     error_count = 0
 
-    click.echo(f"Processing {total_files} file(s)...\n")
+    if isinstance(file_paths, list):
+        click.echo(f"Processing {len(file_paths)} file(s)...\n")
+    else:
+        click.echo("Processing files...\n")
+
+    def flush(db: GrailDatabase, batch: List):
+        """
+        Write a batch of ingested files and report each result in order.
+
+        Progress lines are written to stdout in one call per batch;
+        errors still go to stderr immediately.
+        """
+        nonlocal inserted_count, updated_count, duplicate_count, error_count
+
+        # Entries with no file data are content already known to be stored;
+        # a row the database rejects fails only its own file
+        results = db.insert_grail_files([file_data for _, file_data in batch])
+
+        lines = []
+        for (file_path, _), result in zip(batch, results):
+            if isinstance(result, DatabaseError):
+                click.echo(f"✗ {file_path}: Database error: {result}", err=True)
+                error_count += 1
+                continue
+
+            if result == 'inserted':
+                lines.append(f"✓ {file_path} (new)")
+                inserted_count += 1
+            elif result == 'updated':
+                lines.append(f"↻ {file_path} (updated)")
+                updated_count += 1
+            elif result == 'duplicate':
+                lines.append(f"⊘ {file_path} (duplicate content, skipped)")
+                duplicate_count += 1
+
+        if lines:
+            click.echo("\n".join(lines))
 
     try:
-        with GrailDatabase(db_config, database_name) as db:
-            for file_path in file_paths:
-                try:
-                    # Ingest the file
-                    file_data = ingest_json_file(file_path)
-
-                    # Insert/update in database
-                    result = db.insert_grail_file(
-                        file_path=file_data.file_path,
-                        json_content=file_data.json_content,
-                        content_hash=file_data.content_hash,
-                        ticker=file_data.ticker,
-                        asset_type=file_data.asset_type,
-                        file_created_at=file_data.file_created_at,
-                        file_modified_at=file_data.file_modified_at,
-                        # Core fields
-                        status=file_data.status,
-                        error_message=file_data.error_message,
-                        trade_style=file_data.trade_style,
-                        account_size=file_data.account_size,
-                        risk_percent=file_data.risk_percent,
-                        # Trading decision
-                        should_trade=file_data.should_trade,
-                        trade_action=file_data.trade_action,
-                        trade_confidence_text=file_data.trade_confidence_text,
-                        trade_confidence_pct=file_data.trade_confidence_pct,
-                        no_trade_reason=file_data.no_trade_reason,
-                        # Entry fields
-                        entry_direction=file_data.entry_direction,
-                        entry_price=file_data.entry_price,
-                        entry_recommendation=file_data.entry_recommendation,
-                        # Position sizing
-                        position_quantity=file_data.position_quantity,
-                        position_unit_type=file_data.position_unit_type,
-                        position_size_recommendation=file_data.position_size_recommendation,
-                        position_total_cost_text=file_data.position_total_cost_text,
-                        position_max_risk_text=file_data.position_max_risk_text,
-                        # Market context
-                        market_status=file_data.market_status,
-                        is_tradeable_now=file_data.is_tradeable_now,
-                        in_trial=file_data.in_trial,
-                        # API tracking
-                        runs_remaining=file_data.runs_remaining,
-                        daily_runs_remaining=file_data.daily_runs_remaining,
-                        # Ticker resolution
-                        resolved_ticker=file_data.resolved_ticker,
-                        resolved_ticker_method=file_data.resolved_ticker_method,
-                        # Agent confidence
-                        technical_confidence=file_data.technical_confidence,
-                        macro_confidence=file_data.macro_confidence,
-                        wild_card_risk=file_data.wild_card_risk,
-                        agent_agreement=file_data.agent_agreement,
-                        # Options-specific
-                        option_contract_symbol=file_data.option_contract_symbol,
-                        option_type=file_data.option_type,
-                        option_strike=file_data.option_strike,
-                        option_expiration=file_data.option_expiration,
-                        option_days_to_expiry=file_data.option_days_to_expiry,
-                        option_delta=file_data.option_delta,
-                        option_mid_price=file_data.option_mid_price,
-                        option_volume=file_data.option_volume,
-                        option_open_interest=file_data.option_open_interest
-                    )
-
-                    if result == 'inserted':
-                        click.echo(f"✓ {file_path} (new)")
-                        inserted_count += 1
-                    elif result == 'updated':
-                        click.echo(f"↻ {file_path} (updated)")
-                        updated_count += 1
-                    elif result == 'duplicate':
-                        click.echo(f"⊘ {file_path} (duplicate content, skipped)")
-                        duplicate_count += 1
-
-                except IngestionError as e:
-                    click.echo(f"✗ {file_path}: {e}", err=True)
-                    error_count += 1
+        with GrailDatabase(db_config, database_name, autocommit=False, bulk_mode=bulk_load) as db:
+            # Content already in the database is skipped before parsing
+            known_hashes = db.get_content_hashes()
 
-                except DatabaseError as e:
-                    click.echo(f"✗ {file_path}: Database error: {e}", err=True)
+            # Rebuilding indexes once beats maintaining them row by row when
+            # the load is large next to what is already stored
+            if (
+                not bulk_load
+                and isinstance(file_paths, list)
+                and len(file_paths) >= AUTO_BULK_MIN_FILES
+                and len(file_paths) > AUTO_BULK_RATIO * len(known_hashes)
+            ):
+                db.disable_indexes()
+
+            batch = []
+            for file_path, file_data in ingest_json_files(file_paths, workers, known_hashes):
+                if isinstance(file_data, IngestionError):
+                    click.echo(f"✗ {file_path}: {file_data}", err=True)
                     error_count += 1
+                    continue
+
+                # Database writes and progress output are batched
+                batch.append((file_path, file_data))
+                if len(batch) >= BATCH_SIZE:
+                    flush(db, batch)
+                    batch = []
+
+            if batch:
+                flush(db, batch)
 
     except DatabaseError as e:
         click.echo(f"\nFatal database error: {e}", err=True)
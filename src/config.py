@@ -2,6 +2,8 @@
 Configuration loading and validation for database credentials.
 """
 
+import copy
+import functools
 import os
 import sys
 from pathlib import Path
@@ -19,11 +21,48 @@ else:
         sys.exit(1)
 
 
+# Default configuration file, relative to the user's home directory
+DEFAULT_CONFIG_PATH = Path('.config') / 'postgres' / 'save-grail-json.toml'
+
+
 class ConfigError(Exception):
     """Custom exception for configuration errors."""
     pass
 
 
+def env_flag(name: str) -> bool:
+    """
+    Read a boolean environment variable.
+
+    Only "1", "true" and "yes" (any case) count as set, so values like "0"
+    or "false" leave the flag off.
+    """
+    return os.environ.get(name, '').strip().lower() in ('1', 'true', 'yes')
+
+
+@functools.lru_cache(maxsize=1)
+def _default_config_path() -> Path:
+    """
+    Resolve DEFAULT_CONFIG_PATH under the home directory, once it is needed.
+
+    Path.home() raises RuntimeError without HOME or a passwd entry, so this
+    isn't done at import, where it would break runs given --config or
+    GRAIL_DB_CONFIG.
+    """
+    return Path.home() / DEFAULT_CONFIG_PATH
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_toml(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """
+    Parse a TOML file, memoized by path and modification time.
+
+    The mtime is part of the cache key so an edited file is parsed again.
+    """
+    with open(path, 'rb') as f:
+        return tomllib.load(f)
+
+
 class DatabaseConfig:
     """Database configuration loaded from TOML file."""
 
@@ -54,11 +93,19 @@ class DatabaseConfig:
         if env_config:
             return Path(env_config).expanduser()
 
-        return Path.home() / '.config' / 'postgres' / 'save-grail-json.toml'
+        try:
+            return _default_config_path()
+        except RuntimeError as e:
+            raise ConfigError(
+                f"Cannot locate the default configuration file ({e}); "
+                f"pass --config or set GRAIL_DB_CONFIG"
+            )
 
     def _load_config(self) -> Dict[str, Any]:
         """Load and parse the TOML configuration file."""
-        if not self.config_path.exists():
+        try:
+            mtime_ns = self.config_path.stat().st_mtime_ns
+        except FileNotFoundError:
             raise ConfigError(
                 f"Configuration file not found: {self.config_path}\n"
                 f"Please create the file with database credentials.\n"
@@ -66,8 +113,8 @@ class DatabaseConfig:
             )
 
         try:
-            with open(self.config_path, 'rb') as f:
-                return tomllib.load(f)
+            # Copy so callers can't mutate the cached result
+            return copy.deepcopy(_parse_toml(str(self.config_path), mtime_ns))
         except Exception as e:
             raise ConfigError(f"Error parsing configuration file: {e}")
 
@@ -85,27 +132,27 @@ class DatabaseConfig:
                 f"Missing required fields in [server] section: {', '.join(missing_fields)}"
             )
 
-    @property
+    @functools.cached_property
     def host(self) -> str:
         """Database host."""
         return self.config['server']['host']
 
-    @property
+    @functools.cached_property
     def port(self) -> int:
         """Database port."""
         return int(self.config['server']['port'])
 
-    @property
+    @functools.cached_property
     def user(self) -> str:
         """Database user."""
         return self.config['server']['user']
 
-    @property
+    @functools.cached_property
     def password(self) -> str:
         """Database password."""
         return self.config['server']['password']
 
-    @property
+    @functools.cached_property
     def database(self) -> str:
         """Database name (defaults to 'grail_files' if not specified)."""
         return self.config['server'].get('database', 'grail_files')
@@ -2,13 +2,191 @@
 Database operations for PostgreSQL storage.
 """
 
-from datetime import datetime
-from typing import Optional, Dict, Any
+import io
+import operator
+from typing import Optional, Dict, Any, List, Set, Tuple, Union
 import psycopg2
+import psycopg2.errors
 from psycopg2 import sql
-from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
-
-from src.config import DatabaseConfig
+from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT, TRANSACTION_STATUS_IDLE
+from psycopg2.extras import execute_values
+
+from src.config import DatabaseConfig, env_flag
+from src.db_pool import get_pool
+
+
+# Columns written for each grail file, in bind order
+GRAIL_FILE_COLUMNS = (
+    'ticker', 'asset_type', 'file_path', 'content_hash',
+    'file_created_at', 'file_modified_at', 'json_content',
+    # Core fields
+    'status', 'error_message', 'trade_style', 'account_size', 'risk_percent',
+    # Trading decision
+    'should_trade', 'trade_action', 'trade_confidence_text', 'trade_confidence_pct',
+    'no_trade_reason',
+    # Entry fields
+    'entry_direction', 'entry_price', 'entry_recommendation',
+    # Position sizing
+    'position_quantity', 'position_unit_type', 'position_size_recommendation',
+    'position_total_cost_text', 'position_max_risk_text',
+    # Market context
+    'market_status', 'is_tradeable_now', 'in_trial',
+    # API tracking
+    'runs_remaining', 'daily_runs_remaining',
+    # Ticker resolution
+    'resolved_ticker', 'resolved_ticker_method',
+    # Agent confidence
+    'technical_confidence', 'macro_confidence', 'wild_card_risk', 'agent_agreement',
+    # Options-specific
+    'option_contract_symbol', 'option_type', 'option_strike', 'option_expiration',
+    'option_days_to_expiry', 'option_delta', 'option_mid_price',
+    'option_volume', 'option_open_interest',
+)
+
+# Columns rewritten when a known file_path gets new content
+_UPDATE_COLUMNS = tuple(column for column in GRAIL_FILE_COLUMNS if column != 'file_path')
+
+# Read all bind values from a GrailFileData in one call, as a tuple
+_row_values = operator.attrgetter(*GRAIL_FILE_COLUMNS)
+
+# SET clause shared by every upsert: take the new row's values
+_UPSERT_ASSIGNMENTS = ', '.join(
+    f"{column} = EXCLUDED.{column}" for column in _UPDATE_COLUMNS
+) + ", updated_at = CURRENT_TIMESTAMP"
+
+
+def _bind_expression(column: str, placeholder: str) -> str:
+    """
+    Wrap a column's bind placeholder for the server.
+
+    content_hash is stored as the raw 32-byte digest (bytea); Python keeps
+    passing the hex string and the server decodes it.
+    """
+    if column == 'content_hash':
+        return f"decode({placeholder}, 'hex')"
+    return placeholder
+
+
+def _placeholders(count: int) -> str:
+    """Build a '$1, $2, ...' parameter list for a prepared statement."""
+    return ', '.join(
+        _bind_expression(column, f"${number}")
+        for number, column in enumerate(GRAIL_FILE_COLUMNS[:count], 1)
+    )
+
+
+# Server-side prepared statements used by insert_grail_file() and
+# file_exists(). They are planned once per connection and then run with
+# EXECUTE, so the server does not re-parse the ~45-column statements for
+# every file.
+#
+# grail_upsert writes a file in one statement: nothing is inserted when
+# the content is already stored under any path (no row is returned), a
+# known file_path is updated in place, and (xmax = 0) tells a fresh
+# insert from an update.
+_PREPARED_STATEMENTS = {
+    'grail_find_path': "SELECT id FROM grail_files WHERE file_path = $1",
+    'grail_upsert': (
+        "INSERT INTO grail_files ({columns}) SELECT {placeholders} "
+        "WHERE NOT EXISTS (SELECT 1 FROM grail_files WHERE content_hash = decode(${hash}, 'hex')) "
+        "ON CONFLICT (file_path) DO UPDATE SET {assignments} "
+        "RETURNING (xmax = 0) AS inserted"
+    ).format(
+        columns=', '.join(GRAIL_FILE_COLUMNS),
+        placeholders=_placeholders(len(GRAIL_FILE_COLUMNS)),
+        hash=GRAIL_FILE_COLUMNS.index('content_hash') + 1,
+        assignments=_UPSERT_ASSIGNMENTS,
+    ),
+}
+
+_EXECUTE_FIND_PATH = "EXECUTE grail_find_path (%s)"
+_EXECUTE_UPSERT = "EXECUTE grail_upsert ({})".format(
+    ', '.join(['%s'] * len(GRAIL_FILE_COLUMNS))
+)
+# Same write behind a savepoint, sent in the same round-trip
+_SAVEPOINT_EXECUTE_UPSERT = "SAVEPOINT grail_file; " + _EXECUTE_UPSERT
+
+# Number of rows sent per multi-row INSERT statement
+BULK_PAGE_SIZE = 1000
+
+# Row template for execute_values
+_BULK_TEMPLATE = "({})".format(
+    ', '.join(_bind_expression(column, '%s') for column in GRAIL_FILE_COLUMNS)
+)
+
+# Multi-row upsert used by insert_grail_files_bulk(). Rows whose file_path
+# already exists are updated in place; (xmax = 0) is true only for rows
+# that were freshly inserted, which lets us report inserted vs. updated.
+_BULK_UPSERT_SQL = (
+    "INSERT INTO grail_files ({columns}) VALUES %s "
+    "ON CONFLICT (file_path) DO UPDATE SET {assignments} "
+    "RETURNING file_path, (xmax = 0) AS inserted"
+).format(
+    columns=', '.join(GRAIL_FILE_COLUMNS),
+    assignments=_UPSERT_ASSIGNMENTS,
+)
+
+# Rows fetched per round-trip when migrations stream existing data
+MIGRATE_PAGE_SIZE = 1000
+
+# Rows fetched per round-trip when preloading hashes or paths into a set
+PRELOAD_PAGE_SIZE = 10000
+
+# Batches with at least this many new rows are loaded with COPY instead
+COPY_THRESHOLD = 100
+
+# Session-local staging table for COPY loads (temporary tables skip the WAL)
+# (content_hash is staged as hex text and decoded on the way out)
+_CREATE_STAGE_SQL = (
+    "CREATE TEMP TABLE IF NOT EXISTS grail_files_stage AS "
+    "SELECT {columns} FROM grail_files WITH NO DATA"
+).format(columns=', '.join(
+    "encode(content_hash, 'hex') AS content_hash" if column == 'content_hash' else column
+    for column in GRAIL_FILE_COLUMNS
+))
+
+_COPY_STAGE_SQL = "COPY grail_files_stage ({columns}) FROM STDIN".format(
+    columns=', '.join(GRAIL_FILE_COLUMNS)
+)
+
+_UPSERT_FROM_STAGE_SQL = (
+    "INSERT INTO grail_files ({columns}) SELECT {values} FROM grail_files_stage "
+    "ON CONFLICT (file_path) DO UPDATE SET {assignments} "
+    "RETURNING file_path, (xmax = 0) AS inserted"
+).format(
+    columns=', '.join(GRAIL_FILE_COLUMNS),
+    values=', '.join(_bind_expression(column, column) for column in GRAIL_FILE_COLUMNS),
+    assignments=_UPSERT_ASSIGNMENTS,
+)
+
+# First PostgreSQL version with per-column LZ4 TOAST compression (14)
+LZ4_MIN_SERVER_VERSION = 140000
+
+# Non-unique indexes that bulk mode drops for the load and rebuilds afterwards;
+# the unique indexes stay because they back duplicate detection
+SECONDARY_INDEXES = {
+    'idx_ticker_ingested': (
+        "CREATE INDEX IF NOT EXISTS idx_ticker_ingested ON grail_files(ticker, ingested_at DESC)"
+    ),
+    'idx_ingested_at': "CREATE INDEX IF NOT EXISTS idx_ingested_at ON grail_files(ingested_at)",
+    'idx_content_hash': "CREATE INDEX IF NOT EXISTS idx_content_hash ON grail_files(content_hash)",
+    # Containment (@>) queries on the document; jsonb_path_ops is smaller
+    # and faster than the default operator class for @>
+    'idx_json_content_gin': (
+        "CREATE INDEX IF NOT EXISTS idx_json_content_gin "
+        "ON grail_files USING GIN (json_content jsonb_path_ops)"
+    ),
+}
+
+# Characters that must be escaped in COPY's text format
+_COPY_ESCAPES = str.maketrans({'\\': '\\\\', '\t': '\\t', '\n': '\\n', '\r': '\\r'})
+
+
+def _copy_field(value: Any) -> str:
+    """Encode one value for COPY ... FROM STDIN in text format."""
+    if value is None:
+        return '\\N'
+    return str(value).translate(_COPY_ESCAPES)
 
 
 class DatabaseError(Exception):
@@ -19,18 +197,40 @@ class DatabaseError(Exception):
 class GrailDatabase:
     """Manage PostgreSQL database operations for grail JSON files."""
 
-    def __init__(self, config: DatabaseConfig, database_name: str = None):
+    # (host, port, database) targets whose database and schema have already
+    # been checked in this process
+    _bootstrapped: Set[Tuple[str, int, str]] = set()
+
+    def __init__(
+        self,
+        config: DatabaseConfig,
+        database_name: str = None,
+        autocommit: bool = True,
+        bulk_mode: bool = False
+    ):
         """
         Initialize database manager.
 
         Args:
             config: DatabaseConfig instance with connection parameters
             database_name: Override database name from config
+            autocommit: Commit after every insert_grail_file() call (the
+                default). Batch loaders pass False so single-file writes
+                share a transaction that is committed by commit() or when
+                the context manager exits cleanly; close() on its own
+                discards it.
+            bulk_mode: Drop the secondary indexes on connect and rebuild them
+                on close, so a large load doesn't maintain them row by row.
         """
         self.config = config
         self.database_name = database_name or config.database
+        self.autocommit = autocommit
+        self.bulk_mode = bulk_mode
         self.conn = None
         self.cursor = None
+        self._pool = None
+        self._statements_prepared = False
+        self._indexes_disabled = False
 
     def __enter__(self):
         """Context manager entry."""
@@ -38,32 +238,86 @@ class GrailDatabase:
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        """Context manager exit."""
-        self.close()
+        """Context manager exit; commits pending writes unless an exception occurred."""
+        try:
+            if exc_type is None and self.conn:
+                self.commit()
+        finally:
+            self.close()
+
+    def commit(self):
+        """Commit pending writes."""
+        try:
+            self.conn.commit()
+        except psycopg2.Error as e:
+            raise DatabaseError(f"Failed to commit: {e}")
 
     def connect(self):
         """Establish connection to PostgreSQL database."""
+        # Creating the database and checking the schema only needs to happen
+        # once per process; GRAIL_SKIP_BOOTSTRAP=1 skips it entirely when the
+        # schema is provisioned separately
+        target = (self.config.host, self.config.port, self.database_name)
+        bootstrap = (
+            target not in GrailDatabase._bootstrapped
+            and not env_flag('GRAIL_SKIP_BOOTSTRAP')
+        )
+
         try:
             # First, ensure database exists
-            self._ensure_database_exists()
+            if bootstrap:
+                self._ensure_database_exists()
+
+            # Borrow a connection to the target database from the shared pool
+            self._pool = get_pool(self.config, self.database_name)
+            self.conn = self._pool.getconn()
+        except psycopg2.Error as e:
+            raise DatabaseError(f"Failed to connect to database: {e}")
 
-            # Connect to the target database
-            params = self.config.get_connection_params(self.database_name)
-            self.conn = psycopg2.connect(**params)
+        try:
             self.cursor = self.conn.cursor()
 
             # Ensure table schema exists
-            self._ensure_schema_exists()
+            if bootstrap:
+                self._ensure_schema_exists()
+                GrailDatabase._bootstrapped.add(target)
+
+            if self.bulk_mode:
+                self.disable_indexes()
 
         except psycopg2.Error as e:
+            # Hand the connection back so a failed connect doesn't leak a pool slot
+            self._release_connection()
             raise DatabaseError(f"Failed to connect to database: {e}")
+        except DatabaseError:
+            self._release_connection()
+            raise
 
     def close(self):
-        """Close database connection."""
+        """Return the database connection to the pool."""
+        try:
+            if self.conn and self._indexes_disabled:
+                # Indexes must come back even if the load failed part way.
+                # Anything still uncommitted here was abandoned (close()
+                # discards it anyway), so roll it back rather than letting the
+                # rebuild's commit make it durable; the rebuild then runs in
+                # its own transaction
+                if self.conn.get_transaction_status() != TRANSACTION_STATUS_IDLE:
+                    self.conn.rollback()
+                self.rebuild_indexes()
+        finally:
+            self._release_connection()
+
+    def _release_connection(self):
+        """Close the cursor and return the connection to the pool."""
         if self.cursor:
             self.cursor.close()
+            self.cursor = None
         if self.conn:
-            self.conn.close()
+            # The pool rolls back any transaction left open
+            self._pool.putconn(self.conn)
+            self.conn = None
+        self._statements_prepared = False
 
     def _ensure_database_exists(self):
         """Create database if it doesn't exist."""
@@ -103,8 +357,8 @@ class GrailDatabase:
             id SERIAL PRIMARY KEY,
             ticker VARCHAR(20),
             asset_type VARCHAR(50),
-            file_path TEXT NOT NULL UNIQUE,
-            content_hash VARCHAR(64) NOT NULL UNIQUE,
+            file_path TEXT NOT NULL,
+            content_hash BYTEA NOT NULL UNIQUE,
             file_created_at TIMESTAMP,
             file_modified_at TIMESTAMP,
             json_content JSONB NOT NULL,
@@ -123,24 +377,75 @@ class GrailDatabase:
             # Migrate json_content from TEXT to JSONB if needed
             self._migrate_text_to_jsonb()
 
+            # Store content_hash as raw digest bytes instead of hex text
+            self._migrate_hash_to_bytea()
+
+            # Compress stored documents with LZ4 where the server supports it
+            self._use_lz4_compression()
+
+            # idx_ticker_ingested replaces these; asset_type has too few
+            # distinct values for its index to be worth maintaining
+            self.cursor.execute("DROP INDEX IF EXISTS idx_ticker, idx_asset_type")
+
             # Create indexes (safe to run after migration)
-            index_sql = """
-            CREATE INDEX IF NOT EXISTS idx_ticker ON grail_files(ticker);
-            CREATE INDEX IF NOT EXISTS idx_asset_type ON grail_files(asset_type);
-            CREATE INDEX IF NOT EXISTS idx_ingested_at ON grail_files(ingested_at);
-            CREATE INDEX IF NOT EXISTS idx_content_hash ON grail_files(content_hash);
-            """
-            self.cursor.execute(index_sql)
+            for index_sql in SECONDARY_INDEXES.values():
+                self.cursor.execute(index_sql)
+
+            # file_path uniqueness comes from the covering index (which
+            # ON CONFLICT (file_path) infers); drop the plain UNIQUE
+            # constraint older tables have so writes don't maintain both
+            self.cursor.execute("""
+                CREATE UNIQUE INDEX IF NOT EXISTS idx_file_path_cov
+                ON grail_files(file_path) INCLUDE (id, content_hash)
+            """)
+            self.cursor.execute(
+                "ALTER TABLE grail_files DROP CONSTRAINT IF EXISTS grail_files_file_path_key"
+            )
             self.conn.commit()
 
         except psycopg2.Error as e:
             self.conn.rollback()
             raise DatabaseError(f"Failed to create table schema: {e}")
 
+    def disable_indexes(self):
+        """
+        Drop the secondary indexes ahead of a bulk load.
+
+        Raises:
+            DatabaseError: If the indexes cannot be dropped
+        """
+        try:
+            for name in SECONDARY_INDEXES:
+                self.cursor.execute(
+                    sql.SQL("DROP INDEX IF EXISTS {}").format(sql.Identifier(name))
+                )
+            self.conn.commit()
+            self._indexes_disabled = True
+        except psycopg2.Error as e:
+            self.conn.rollback()
+            raise DatabaseError(f"Failed to drop indexes: {e}")
+
+    def rebuild_indexes(self):
+        """
+        Recreate the secondary indexes after a bulk load.
+
+        Each index is built with one sort over the table instead of being
+        updated for every inserted row.
+
+        Raises:
+            DatabaseError: If an index cannot be created
+        """
+        try:
+            for index_sql in SECONDARY_INDEXES.values():
+                self.cursor.execute(index_sql)
+            self.conn.commit()
+            self._indexes_disabled = False
+        except psycopg2.Error as e:
+            self.conn.rollback()
+            raise DatabaseError(f"Failed to rebuild indexes: {e}")
+
     def _migrate_add_content_hash(self):
         """Add content_hash and updated_at columns to existing tables if needed."""
-        import hashlib
-
         try:
             # Check if content_hash column exists
             self.cursor.execute("""
@@ -163,17 +468,18 @@ class GrailDatabase:
             """)
             self.conn.commit()
 
-            # Compute hashes for existing records
-            self.cursor.execute("SELECT id, json_content FROM grail_files")
-            rows = self.cursor.fetchall()
-
-            for row_id, json_content in rows:
-                content_hash = hashlib.sha256(json_content.encode('utf-8')).hexdigest()
-                self.cursor.execute(
-                    "UPDATE grail_files SET content_hash = %s WHERE id = %s",
-                    (content_hash, row_id)
-                )
-            self.conn.commit()
+            # Compute hashes for existing records in one server-side UPDATE
+            # (sha256() is built in from PostgreSQL 11)
+            try:
+                self.cursor.execute("""
+                    UPDATE grail_files
+                    SET content_hash = encode(sha256(convert_to(json_content::text, 'UTF8')), 'hex')
+                    WHERE content_hash IS NULL
+                """)
+                self.conn.commit()
+            except psycopg2.errors.UndefinedFunction:
+                self.conn.rollback()
+                self._hash_existing_rows()
 
             # Now add constraints
             self.cursor.execute("""
@@ -194,6 +500,84 @@ class GrailDatabase:
             # Don't raise - let the caller handle it
             pass
 
+    def _hash_existing_rows(self):
+        """Compute missing content hashes in Python (servers without sha256())."""
+        import hashlib
+
+        # Stream rows through a server-side cursor so memory stays bounded
+        with self.conn.cursor(name='grail_migrate') as reader:
+            reader.itersize = MIGRATE_PAGE_SIZE
+            reader.execute("SELECT id, json_content FROM grail_files WHERE content_hash IS NULL")
+
+            # Updates go out MIGRATE_PAGE_SIZE rows per statement
+            execute_values(
+                self.cursor,
+                "UPDATE grail_files SET content_hash = v.content_hash "
+                "FROM (VALUES %s) AS v(id, content_hash) WHERE grail_files.id = v.id",
+                (
+                    (row_id, hashlib.sha256(json_content.encode('utf-8')).hexdigest())
+                    for row_id, json_content in reader
+                ),
+                page_size=MIGRATE_PAGE_SIZE,
+            )
+        self.conn.commit()
+
+    def _migrate_hash_to_bytea(self):
+        """Convert a hex VARCHAR(64) content_hash column to BYTEA if needed."""
+        try:
+            self.cursor.execute("""
+                SELECT data_type
+                FROM information_schema.columns
+                WHERE table_name='grail_files' AND column_name='content_hash'
+            """)
+            result = self.cursor.fetchone()
+
+            # Column missing or already converted, nothing to do
+            if not result or result[0] == 'bytea':
+                return
+
+            # Rewrites the column and rebuilds its unique index at half the width
+            self.cursor.execute("""
+                ALTER TABLE grail_files
+                ALTER COLUMN content_hash TYPE BYTEA USING decode(content_hash, 'hex')
+            """)
+            self.conn.commit()
+
+        except psycopg2.Error:
+            # If migration fails, rollback but don't raise
+            self.conn.rollback()
+
+    def _use_lz4_compression(self):
+        """
+        Switch json_content's TOAST compression from pglz to LZ4.
+
+        Needs PostgreSQL 14+ built with LZ4; otherwise the default stays.
+        Only newly written values are affected.
+        """
+        if self.conn.server_version < LZ4_MIN_SERVER_VERSION:
+            return
+
+        try:
+            self.cursor.execute("""
+                SELECT attcompression
+                FROM pg_attribute
+                WHERE attrelid = 'grail_files'::regclass AND attname = 'json_content'
+            """)
+            result = self.cursor.fetchone()
+
+            # Already set, nothing to do
+            if not result or result[0] == 'l':
+                return
+
+            self.cursor.execute("""
+                ALTER TABLE grail_files ALTER COLUMN json_content SET COMPRESSION lz4
+            """)
+            self.conn.commit()
+
+        except psycopg2.Error:
+            # Server built without LZ4; keep the default compression
+            self.conn.rollback()
+
     def _migrate_text_to_jsonb(self):
         """Migrate json_content column from TEXT to JSONB if needed."""
         try:
@@ -224,74 +608,38 @@ class GrailDatabase:
             # Don't raise - let the caller handle it
             pass
 
-    def insert_grail_file(
-        self,
-        file_path: str,
-        json_content: str,
-        content_hash: str,
-        ticker: Optional[str] = None,
-        asset_type: Optional[str] = None,
-        file_created_at: Optional[datetime] = None,
-        file_modified_at: Optional[datetime] = None,
-        # Core fields
-        status: Optional[str] = None,
-        error_message: Optional[str] = None,
-        trade_style: Optional[str] = None,
-        account_size: Optional[float] = None,
-        risk_percent: Optional[float] = None,
-        # Trading decision
-        should_trade: Optional[bool] = None,
-        trade_action: Optional[str] = None,
-        trade_confidence_text: Optional[str] = None,
-        trade_confidence_pct: Optional[float] = None,
-        no_trade_reason: Optional[str] = None,
-        # Entry fields
-        entry_direction: Optional[str] = None,
-        entry_price: Optional[float] = None,
-        entry_recommendation: Optional[str] = None,
-        # Position sizing
-        position_quantity: Optional[int] = None,
-        position_unit_type: Optional[str] = None,
-        position_size_recommendation: Optional[str] = None,
-        position_total_cost_text: Optional[str] = None,
-        position_max_risk_text: Optional[str] = None,
-        # Market context
-        market_status: Optional[str] = None,
-        is_tradeable_now: Optional[bool] = None,
-        in_trial: Optional[bool] = None,
-        # API tracking
-        runs_remaining: Optional[int] = None,
-        daily_runs_remaining: Optional[int] = None,
-        # Ticker resolution
-        resolved_ticker: Optional[str] = None,
-        resolved_ticker_method: Optional[str] = None,
-        # Agent confidence
-        technical_confidence: Optional[float] = None,
-        macro_confidence: Optional[float] = None,
-        wild_card_risk: Optional[str] = None,
-        agent_agreement: Optional[str] = None,
-        # Options-specific
-        option_contract_symbol: Optional[str] = None,
-        option_type: Optional[str] = None,
-        option_strike: Optional[float] = None,
-        option_expiration: Optional[str] = None,
-        option_days_to_expiry: Optional[int] = None,
-        option_delta: Optional[float] = None,
-        option_mid_price: Optional[float] = None,
-        option_volume: Optional[int] = None,
-        option_open_interest: Optional[int] = None
-    ) -> str:
+    def _prepare_statements(self):
+        """
+        PREPARE the single-row statements on this connection if needed.
+
+        Pooled connections keep their prepared statements between uses, so
+        only the ones missing from pg_prepared_statements are created.
+        """
+        if self._statements_prepared:
+            return
+
+        self.cursor.execute(
+            "SELECT name FROM pg_prepared_statements WHERE name = ANY(%s)",
+            (list(_PREPARED_STATEMENTS),)
+        )
+        existing = {name for (name,) in self.cursor.fetchall()}
+
+        for name, statement in _PREPARED_STATEMENTS.items():
+            if name not in existing:
+                self.cursor.execute(f"PREPARE {name} AS {statement}")
+        self._statements_prepared = True
+
+    def insert_grail_file(self, file_data: Any) -> str:
         """
         Insert or update a grail JSON file in the database.
 
+        Unless the instance was created with autocommit=True, the write is
+        only made durable by commit() or a clean exit from the context
+        manager, so many files share one commit.
+
         Args:
-            file_path: Path to the JSON file
-            json_content: Complete JSON content as string
-            content_hash: SHA256 hash of json_content
-            ticker: Ticker symbol extracted from JSON
-            asset_type: Asset type extracted from JSON
-            file_created_at: File creation timestamp
-            file_modified_at: File modification timestamp
+            file_data: GrailFileData-like object exposing GRAIL_FILE_COLUMNS
+                as attributes
 
         Returns:
             'inserted' - New file added
@@ -301,153 +649,210 @@ class GrailDatabase:
         Raises:
             DatabaseError: If database operation fails
         """
+        in_savepoint = False
         try:
-            # Check if this exact content already exists
-            self.cursor.execute(
-                "SELECT file_path FROM grail_files WHERE content_hash = %s",
-                (content_hash,)
-            )
-            existing_content = self.cursor.fetchone()
+            self._prepare_statements()
+
+            if self.autocommit:
+                self.cursor.execute(_EXECUTE_UPSERT, _row_values(file_data))
+            else:
+                # A savepoint keeps a failure here from discarding earlier
+                # uncommitted writes in the same transaction
+                in_savepoint = True
+                self.cursor.execute(_SAVEPOINT_EXECUTE_UPSERT, _row_values(file_data))
+            written = self.cursor.fetchone()
+
+            if self.autocommit:
+                self.conn.commit()
+            else:
+                self.cursor.execute("RELEASE SAVEPOINT grail_file")
 
-            if existing_content:
+            if written is None:
                 # Exact same content already exists
                 return 'duplicate'
+            return 'inserted' if written[0] else 'updated'
 
-            # Check if this file path already exists (with different content)
-            self.cursor.execute(
-                "SELECT id FROM grail_files WHERE file_path = %s",
-                (file_path,)
-            )
-            existing_path = self.cursor.fetchone()
-
-            if existing_path:
-                # Update existing record with new content
-                update_sql = """
-                UPDATE grail_files
-                SET ticker = %s,
-                    asset_type = %s,
-                    content_hash = %s,
-                    file_created_at = %s,
-                    file_modified_at = %s,
-                    json_content = %s,
-                    status = %s,
-                    error_message = %s,
-                    trade_style = %s,
-                    account_size = %s,
-                    risk_percent = %s,
-                    should_trade = %s,
-                    trade_action = %s,
-                    trade_confidence_text = %s,
-                    trade_confidence_pct = %s,
-                    no_trade_reason = %s,
-                    entry_direction = %s,
-                    entry_price = %s,
-                    entry_recommendation = %s,
-                    position_quantity = %s,
-                    position_unit_type = %s,
-                    position_size_recommendation = %s,
-                    position_total_cost_text = %s,
-                    position_max_risk_text = %s,
-                    market_status = %s,
-                    is_tradeable_now = %s,
-                    in_trial = %s,
-                    runs_remaining = %s,
-                    daily_runs_remaining = %s,
-                    resolved_ticker = %s,
-                    resolved_ticker_method = %s,
-                    technical_confidence = %s,
-                    macro_confidence = %s,
-                    wild_card_risk = %s,
-                    agent_agreement = %s,
-                    option_contract_symbol = %s,
-                    option_type = %s,
-                    option_strike = %s,
-                    option_expiration = %s,
-                    option_days_to_expiry = %s,
-                    option_delta = %s,
-                    option_mid_price = %s,
-                    option_volume = %s,
-                    option_open_interest = %s,
-                    updated_at = CURRENT_TIMESTAMP
-                WHERE file_path = %s
-                """
-                self.cursor.execute(
-                    update_sql,
-                    (ticker, asset_type, content_hash, file_created_at,
-                     file_modified_at, json_content,
-                     status, error_message, trade_style, account_size, risk_percent,
-                     should_trade, trade_action, trade_confidence_text, trade_confidence_pct,
-                     no_trade_reason, entry_direction, entry_price, entry_recommendation,
-                     position_quantity, position_unit_type, position_size_recommendation,
-                     position_total_cost_text, position_max_risk_text,
-                     market_status, is_tradeable_now, in_trial,
-                     runs_remaining, daily_runs_remaining,
-                     resolved_ticker, resolved_ticker_method,
-                     technical_confidence, macro_confidence, wild_card_risk, agent_agreement,
-                     option_contract_symbol, option_type, option_strike, option_expiration,
-                     option_days_to_expiry, option_delta, option_mid_price,
-                     option_volume, option_open_interest,
-                     file_path)
-                )
-                self.conn.commit()
-                return 'updated'
-
-            # Insert new record
-            insert_sql = """
-            INSERT INTO grail_files (
-                ticker, asset_type, file_path, content_hash,
-                file_created_at, file_modified_at, json_content,
-                status, error_message, trade_style, account_size, risk_percent,
-                should_trade, trade_action, trade_confidence_text, trade_confidence_pct,
-                no_trade_reason, entry_direction, entry_price, entry_recommendation,
-                position_quantity, position_unit_type, position_size_recommendation,
-                position_total_cost_text, position_max_risk_text,
-                market_status, is_tradeable_now, in_trial,
-                runs_remaining, daily_runs_remaining,
-                resolved_ticker, resolved_ticker_method,
-                technical_confidence, macro_confidence, wild_card_risk, agent_agreement,
-                option_contract_symbol, option_type, option_strike, option_expiration,
-                option_days_to_expiry, option_delta, option_mid_price,
-                option_volume, option_open_interest
-            ) VALUES (
-                %s, %s, %s, %s, %s, %s, %s,
-                %s, %s, %s, %s, %s,
-                %s, %s, %s, %s,
-                %s, %s, %s, %s,
-                %s, %s, %s,
-                %s, %s,
-                %s, %s, %s,
-                %s, %s,
-                %s, %s,
-                %s, %s, %s, %s,
-                %s, %s, %s, %s,
-                %s, %s, %s,
-                %s, %s
-            )
-            """
+        except psycopg2.Error as e:
+            self._rollback_file(in_savepoint)
+            raise DatabaseError(f"Failed to insert/update file: {e}")
+
+    def _rollback_file(self, in_savepoint: bool):
+        """Undo a failed single-file write."""
+        if in_savepoint:
+            try:
+                self.cursor.execute("ROLLBACK TO SAVEPOINT grail_file")
+                return
+            except psycopg2.Error:
+                pass
+        self.conn.rollback()
+
+    def insert_grail_files_bulk(self, rows: List[Any]) -> List[str]:
+        """
+        Insert or update a batch of grail JSON files in a single round-trip.
+
+        Duplicate content (already stored, or repeated within the batch) is
+        filtered out first; the remaining rows are written with one
+        multi-row INSERT ... ON CONFLICT (file_path) DO UPDATE statement
+        (or, for COPY_THRESHOLD rows or more, COPY into a staging table
+        followed by the same upsert). The batch is committed as one unit,
+        whatever the autocommit setting.
+
+        Args:
+            rows: GrailFileData-like objects exposing GRAIL_FILE_COLUMNS
+                as attributes
+
+        Returns:
+            List of results in the same order as rows, each one of
+            'inserted', 'updated' or 'duplicate' (see insert_grail_file)
+
+        Raises:
+            DatabaseError: If database operation fails
+        """
+        if not rows:
+            return []
+
+        try:
+            # Find content that is already stored
             self.cursor.execute(
-                insert_sql,
-                (ticker, asset_type, file_path, content_hash,
-                 file_created_at, file_modified_at, json_content,
-                 status, error_message, trade_style, account_size, risk_percent,
-                 should_trade, trade_action, trade_confidence_text, trade_confidence_pct,
-                 no_trade_reason, entry_direction, entry_price, entry_recommendation,
-                 position_quantity, position_unit_type, position_size_recommendation,
-                 position_total_cost_text, position_max_risk_text,
-                 market_status, is_tradeable_now, in_trial,
-                 runs_remaining, daily_runs_remaining,
-                 resolved_ticker, resolved_ticker_method,
-                 technical_confidence, macro_confidence, wild_card_risk, agent_agreement,
-                 option_contract_symbol, option_type, option_strike, option_expiration,
-                 option_days_to_expiry, option_delta, option_mid_price,
-                 option_volume, option_open_interest)
+                "SELECT encode(content_hash, 'hex') FROM grail_files "
+                "WHERE content_hash = ANY(%s)",
+                ([bytes.fromhex(row.content_hash) for row in rows],)
             )
+            seen_hashes = {content_hash for (content_hash,) in self.cursor.fetchall()}
+
+            results: List[Optional[str]] = [None] * len(rows)
+            pending = []
+            for index, row in enumerate(rows):
+                if row.content_hash in seen_hashes:
+                    results[index] = 'duplicate'
+                    continue
+                seen_hashes.add(row.content_hash)
+                pending.append(index)
+
+            if pending:
+                values = [_row_values(rows[index]) for index in pending]
+                if len(values) >= COPY_THRESHOLD:
+                    written = self._upsert_via_copy(values)
+                else:
+                    written = execute_values(
+                        self.cursor,
+                        _BULK_UPSERT_SQL,
+                        values,
+                        template=_BULK_TEMPLATE,
+                        page_size=BULK_PAGE_SIZE,
+                        fetch=True
+                    )
+                outcome = {
+                    file_path: 'inserted' if inserted else 'updated'
+                    for file_path, inserted in written
+                }
+                for index in pending:
+                    results[index] = outcome[rows[index].file_path]
+
             self.conn.commit()
-            return 'inserted'
+            return results
 
         except psycopg2.Error as e:
             self.conn.rollback()
-            raise DatabaseError(f"Failed to insert/update file: {e}")
+            raise DatabaseError(f"Failed to insert/update files: {e}")
+
+    def insert_grail_files(self, rows: List[Optional[Any]]) -> List[Union[str, DatabaseError]]:
+        """
+        Write a batch of ingested files, isolating any rows that fail.
+
+        The batch is first written with insert_grail_files_bulk(). If that
+        fails, it is rolled back and the rows are retried one at a time with
+        insert_grail_file(), so one bad row (e.g. a value too large for its
+        column) only fails its own file.
+
+        Args:
+            rows: GrailFileData-like objects, or None for content already
+                known to be stored (reported as 'duplicate' without a write)
+
+        Returns:
+            List of results in the same order as rows, each one of
+            'inserted', 'updated' or 'duplicate' (see insert_grail_file), or
+            the DatabaseError that kept that file from being written
+
+        Raises:
+            DatabaseError: If the per-file retry can't be committed
+        """
+        to_write = [row for row in rows if row is not None]
+        try:
+            written = iter(self.insert_grail_files_bulk(to_write))
+        except DatabaseError:
+            written = iter(self._insert_one_by_one(to_write))
+
+        return ['duplicate' if row is None else next(written) for row in rows]
+
+    def _insert_one_by_one(self, rows: List[Any]) -> List[Union[str, DatabaseError]]:
+        """Write rows with insert_grail_file(), collecting each file's error."""
+        results: List[Union[str, DatabaseError]] = []
+        for row in rows:
+            try:
+                results.append(self.insert_grail_file(row))
+            except DatabaseError as e:
+                results.append(e)
+
+        if not self.autocommit:
+            self.commit()
+        return results
+
+    def _upsert_via_copy(self, values: List[tuple]) -> List[tuple]:
+        """
+        Upsert rows by streaming them into the staging table with COPY.
+
+        Args:
+            values: Row tuples in GRAIL_FILE_COLUMNS order
+
+        Returns:
+            (file_path, inserted) tuples for every written row
+        """
+        self.cursor.execute(_CREATE_STAGE_SQL)
+
+        buffer = io.StringIO()
+        for row in values:
+            buffer.write('\t'.join(map(_copy_field, row)))
+            buffer.write('\n')
+        buffer.seek(0)
+
+        self.cursor.copy_expert(_COPY_STAGE_SQL, buffer)
+        self.cursor.execute(_UPSERT_FROM_STAGE_SQL)
+        written = self.cursor.fetchall()
+        self.cursor.execute("TRUNCATE grail_files_stage")
+        return written
+
+    def get_content_hashes(self) -> Set[str]:
+        """Get the content hashes of every stored file."""
+        try:
+            return {
+                bytes(content_hash).hex()
+                for (content_hash,) in self._stream("SELECT content_hash FROM grail_files")
+            }
+        except psycopg2.Error as e:
+            raise DatabaseError(f"Failed to load content hashes: {e}")
+
+    def get_file_paths(self) -> Set[str]:
+        """
+        Get the path of every stored file.
+
+        Membership tests against this set replace a file_exists() round-trip
+        per file when checking many paths.
+        """
+        try:
+            return {
+                file_path
+                for (file_path,) in self._stream("SELECT file_path FROM grail_files")
+            }
+        except psycopg2.Error as e:
+            raise DatabaseError(f"Failed to load file paths: {e}")
+
+    def _stream(self, query: str):
+        """Yield a query's rows through a server-side cursor, a page at a time."""
+        with self.conn.cursor(name='grail_preload') as reader:
+            reader.itersize = PRELOAD_PAGE_SIZE
+            reader.execute(query)
+            yield from reader
 
     def get_file_count(self) -> int:
         """Get total number of files in database."""
@@ -460,10 +865,8 @@ class GrailDatabase:
     def file_exists(self, file_path: str) -> bool:
         """Check if a file path already exists in database."""
         try:
-            self.cursor.execute(
-                "SELECT 1 FROM grail_files WHERE file_path = %s",
-                (file_path,)
-            )
+            self._prepare_statements()
+            self.cursor.execute(_EXECUTE_FIND_PATH, (file_path,))
             return self.cursor.fetchone() is not None
         except psycopg2.Error as e:
             raise DatabaseError(f"Failed to check file existence: {e}")
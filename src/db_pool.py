@@ -0,0 +1,65 @@
+"""
+Process-wide PostgreSQL connection pools.
+"""
+
+import atexit
+import threading
+from typing import Dict, Tuple
+
+from psycopg2.pool import ThreadedConnectionPool
+
+from src.config import DatabaseConfig, env_flag
+
+
+# Connections kept open per pool
+MIN_CONNECTIONS = 1
+MAX_CONNECTIONS = 8
+
+# Session settings for pooled connections. Ingestion can always be re-run
+# from the files on disk, so commits don't wait for the WAL flush; losing
+# the last moments of commits in a server crash only means re-ingesting
+# them. Set GRAIL_SYNC_COMMIT=1 to keep fully durable commits.
+SESSION_OPTIONS = '-c synchronous_commit=off'
+
+_pools: Dict[Tuple, ThreadedConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(config: DatabaseConfig, database: str = None) -> ThreadedConnectionPool:
+    """
+    Get the shared connection pool for a database, creating it on first use.
+
+    Pools are keyed by connection parameters, so every GrailDatabase in the
+    process that targets the same server and database reuses open
+    connections instead of paying the connect/auth handshake again.
+
+    Args:
+        config: DatabaseConfig instance with connection parameters
+        database: Override database name. If None, uses config value.
+
+    Returns:
+        ThreadedConnectionPool for the target database
+    """
+    params = config.get_connection_params(database)
+    if not env_flag('GRAIL_SYNC_COMMIT'):
+        params['options'] = SESSION_OPTIONS
+    key = tuple(sorted(params.items()))
+
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None or pool.closed:
+            pool = ThreadedConnectionPool(MIN_CONNECTIONS, MAX_CONNECTIONS, **params)
+            _pools[key] = pool
+        return pool
+
+
+def close_all_pools():
+    """Close every pooled connection (registered to run at exit)."""
+    with _pools_lock:
+        for pool in _pools.values():
+            if not pool.closed:
+                pool.closeall()
+        _pools.clear()
+
+
+atexit.register(close_all_pools)
@@ -4,11 +4,57 @@ JSON file ingestion and field extraction.
 
 import json
 import hashlib
+import multiprocessing
 import os
 import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, Any
+from stat import S_ISREG
+from types import MappingProxyType
+from typing import Optional, Dict, Any, AbstractSet, Iterable, Iterator, Sized, Tuple, Union
+
+# Use orjson for parsing when installed; it parses bytes directly and is
+# several times faster than the standard library
+try:
+    import orjson
+
+    def _json_loads(data: Union[bytes, str]) -> Any:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects some documents the standard library accepts
+            # (e.g. integers wider than 64 bits, NaN); retry so the optional
+            # speedup never changes which files can be ingested
+            return json.loads(data)
+except ImportError:
+    _json_loads = json.loads
+
+
+# Files queued per worker process ahead of the consumer in ingest_json_files()
+PREFETCH_PER_WORKER = 32
+
+# Inputs of known length below this are parsed in-process; starting worker
+# processes (and copying the known hashes into each) costs more than it saves
+PARALLEL_MIN_FILES = 32
+
+# Worker processes are started by a fork server (or spawned where that isn't
+# available) rather than forked, since callers such as the TUI run this from
+# a multi-threaded process and forking one can deadlock the child
+_MP_CONTEXT = multiprocessing.get_context(
+    'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+)
+
+# Leading bytes read by is_json_prefix()
+JSON_PROBE_SIZE = 512
+
+# Shared stand-in for missing JSON sections, so lookups don't allocate a
+# fresh dict per miss (read-only so it can't be mutated by accident)
+_EMPTY = MappingProxyType({})
+
+# First number in a confidence string, e.g. "85% confidence - reason"
+_CONFIDENCE_PCT_RE = re.compile(r'(\d+(?:\.\d+)?)%?')
 
 
 class IngestionError(Exception):
@@ -35,7 +81,7 @@ def _extract_confidence_pct(confidence_text: Optional[str]) -> Optional[float]:
         return None
 
     # Extract number before '%' or before ' '
-    match = re.search(r'(\d+(?:\.\d+)?)%?', confidence_text)
+    match = _CONFIDENCE_PCT_RE.search(confidence_text)
     if match:
         try:
             return float(match.group(1))
@@ -76,6 +122,23 @@ def _safe_bool(value: Any) -> Optional[bool]:
 class GrailFileData:
     """Container for extracted grail file data."""
 
+    # No per-instance __dict__; large ingests hold many of these at once
+    __slots__ = (
+        'file_path', 'json_content', 'content_hash', 'ticker', 'asset_type',
+        'file_created_at', 'file_modified_at', 'status', 'error_message', 'trade_style',
+        'account_size', 'risk_percent', 'should_trade', 'trade_action',
+        'trade_confidence_text', 'trade_confidence_pct', 'no_trade_reason',
+        'entry_direction', 'entry_price', 'entry_recommendation', 'position_quantity',
+        'position_unit_type', 'position_size_recommendation',
+        'position_total_cost_text', 'position_max_risk_text', 'market_status',
+        'is_tradeable_now', 'in_trial', 'runs_remaining', 'daily_runs_remaining',
+        'resolved_ticker', 'resolved_ticker_method', 'technical_confidence',
+        'macro_confidence', 'wild_card_risk', 'agent_agreement',
+        'option_contract_symbol', 'option_type', 'option_strike', 'option_expiration',
+        'option_days_to_expiry', 'option_delta', 'option_mid_price', 'option_volume',
+        'option_open_interest'
+    )
+
     def __init__(
         self,
         file_path: str,
@@ -189,40 +252,66 @@ class GrailFileData:
         self.option_open_interest = option_open_interest
 
 
-def ingest_json_file(file_path: str) -> GrailFileData:
+def ingest_json_file(
+    file_path: str,
+    known_hashes: Optional[AbstractSet[str]] = None
+) -> Optional[GrailFileData]:
     """
     Read and process a JSON file for ingestion.
 
+    The content hash is computed from the raw bytes before the JSON is
+    decoded, so files whose content is already stored can be skipped
+    without paying for the parse.
+
     Args:
         file_path: Path to the JSON file
+        known_hashes: Content hashes already stored in the database
 
     Returns:
-        GrailFileData object with extracted information
+        GrailFileData object with extracted information, or None if the
+        content hash is in known_hashes
 
     Raises:
         IngestionError: If file cannot be read or parsed
     """
-    path = Path(file_path)
-
-    # Verify file exists
-    if not path.exists():
+    # Verify the file with a single stat; it also supplies the timestamps
+    try:
+        stat = os.stat(file_path)
+    except FileNotFoundError:
         raise IngestionError(f"File not found: {file_path}")
+    except OSError as e:
+        raise IngestionError(f"Failed to read file {file_path}: {e}")
 
-    if not path.is_file():
+    if not S_ISREG(stat.st_mode):
         raise IngestionError(f"Not a file: {file_path}")
 
     # Read file content
     try:
-        with open(path, 'r', encoding='utf-8') as f:
-            json_content = f.read()
+        with open(file_path, 'rb') as f:
+            raw_content = f.read()
     except Exception as e:
         raise IngestionError(f"Failed to read file {file_path}: {e}")
 
-    # Parse JSON to extract fields
+    # Stored hashes were computed over text read with universal newlines, so
+    # translate CR LF and lone CR the same way before hashing
+    if b'\r' in raw_content:
+        raw_content = raw_content.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+
+    # Compute content hash for duplicate detection. The whole file is needed
+    # in memory for parsing anyway, so hash those bytes rather than streaming
+    # the file a second time (hashlib's OpenSSL SHA-256 uses SHA-NI/AVX2).
+    content_hash = hashlib.sha256(raw_content).hexdigest()
+    if known_hashes and content_hash in known_hashes:
+        return None
+
+    # Parse JSON to extract fields (orjson's error subclasses JSONDecodeError)
     try:
-        data = json.loads(json_content)
+        data = _json_loads(raw_content)
+        json_content = raw_content.decode('utf-8')
     except json.JSONDecodeError as e:
         raise IngestionError(f"Invalid JSON in {file_path}: {e}")
+    except UnicodeDecodeError as e:
+        raise IngestionError(f"Failed to read file {file_path}: {e}")
 
     # Extract ticker and asset_type (if present)
     ticker = data.get('ticker')
@@ -230,7 +319,6 @@ def ingest_json_file(file_path: str) -> GrailFileData:
 
     # Get file timestamps
     try:
-        stat = path.stat()
         # Use birth time if available (creation time), otherwise use ctime
         file_created_at = datetime.fromtimestamp(
             getattr(stat, 'st_birthtime', stat.st_ctime)
@@ -241,9 +329,6 @@ def ingest_json_file(file_path: str) -> GrailFileData:
         file_created_at = None
         file_modified_at = None
 
-    # Compute content hash for duplicate detection
-    content_hash = hashlib.sha256(json_content.encode('utf-8')).hexdigest()
-
     # Extract core fields
     status = data.get('status')
     error_message = data.get('error')
@@ -252,23 +337,23 @@ def ingest_json_file(file_path: str) -> GrailFileData:
     risk_percent = _safe_float(data.get('risk_percent'))
 
     # Extract trading decision fields
-    trade_plan = data.get('trade_plan') or {}
+    trade_plan = data.get('trade_plan') or _EMPTY
     should_trade = _safe_bool(trade_plan.get('trade'))
 
-    verdict = trade_plan.get('verdict') or {}
+    verdict = trade_plan.get('verdict') or _EMPTY
     trade_action = verdict.get('action')
     trade_confidence_text = verdict.get('confidence')
     trade_confidence_pct = _extract_confidence_pct(trade_confidence_text)
     no_trade_reason = trade_plan.get('no_trade_reason')
 
     # Extract entry fields
-    entry = trade_plan.get('entry') or {}
+    entry = trade_plan.get('entry') or _EMPTY
     entry_direction = entry.get('direction')
     entry_price = _safe_float(entry.get('current_price'))
     entry_recommendation = entry.get('recommendation')
 
     # Extract position sizing fields
-    position = trade_plan.get('position') or {}
+    position = trade_plan.get('position') or _EMPTY
     position_quantity = _safe_int(position.get('quantity'))
     position_unit_type = position.get('unit_type')
     position_size_recommendation = position.get('size_recommendation')
@@ -276,7 +361,7 @@ def ingest_json_file(file_path: str) -> GrailFileData:
     position_max_risk_text = position.get('max_risk')
 
     # Extract market context fields
-    market_session = data.get('market_session') or {}
+    market_session = data.get('market_session') or _EMPTY
     market_status = market_session.get('status')
     is_tradeable_now = _safe_bool(market_session.get('is_tradeable_now'))
     in_trial = _safe_bool(data.get('in_trial'))
@@ -290,13 +375,13 @@ def ingest_json_file(file_path: str) -> GrailFileData:
     resolved_ticker_method = data.get('resolved_ticker_method')
 
     # Extract agent confidence fields
-    agent_verdicts = data.get('agent_verdicts') or {}
-    technical = agent_verdicts.get('technical') or {}
-    macro = agent_verdicts.get('macro') or {}
+    agent_verdicts = data.get('agent_verdicts') or _EMPTY
+    technical = agent_verdicts.get('technical') or _EMPTY
+    macro = agent_verdicts.get('macro') or _EMPTY
     technical_confidence = _safe_float(technical.get('confidence'))
     macro_confidence = _safe_float(macro.get('confidence'))
 
-    synthesis = trade_plan.get('synthesis') or {}
+    synthesis = trade_plan.get('synthesis') or _EMPTY
     wild_card_risk = synthesis.get('wild_card_risk')
     agent_agreement = synthesis.get('agent_agreement')
 
@@ -312,7 +397,7 @@ def ingest_json_file(file_path: str) -> GrailFileData:
     option_open_interest = None
 
     if asset_type == 'OPTIONS':
-        recommended_contract = trade_plan.get('recommended_contract') or {}
+        recommended_contract = trade_plan.get('recommended_contract') or _EMPTY
         option_contract_symbol = recommended_contract.get('symbol')
         option_type = recommended_contract.get('type')
         option_strike = _safe_float(recommended_contract.get('strike'))
@@ -324,7 +409,9 @@ def ingest_json_file(file_path: str) -> GrailFileData:
         option_open_interest = _safe_int(recommended_contract.get('open_interest'))
 
     return GrailFileData(
-        file_path=str(path.absolute()),
+        # Path.absolute() keeps '..' segments (os.path.abspath would collapse
+        # them), so stored paths stay identical to earlier ingests
+        file_path=str(Path(file_path).absolute()),
         json_content=json_content,
         content_hash=content_hash,
         ticker=ticker,
@@ -381,24 +468,128 @@ def ingest_json_file(file_path: str) -> GrailFileData:
     )
 
 
+# Content hashes to skip, installed in each worker process by _init_worker()
+_worker_known_hashes: AbstractSet[str] = frozenset()
+
+
+def _init_worker(known_hashes: AbstractSet[str]):
+    """Receive the known content hashes once per worker process."""
+    global _worker_known_hashes
+    _worker_known_hashes = known_hashes
+
+
+def _ingest_or_error(
+    file_path: str,
+    known_hashes: Optional[AbstractSet[str]] = None
+) -> Union[GrailFileData, IngestionError, None]:
+    """Ingest a file, returning the IngestionError instead of raising it."""
+    if known_hashes is None:
+        known_hashes = _worker_known_hashes
+    try:
+        return ingest_json_file(file_path, known_hashes)
+    except IngestionError as e:
+        return e
+
+
+def ingest_json_files(
+    file_paths: Iterable[str],
+    workers: Optional[int] = None,
+    known_hashes: Optional[AbstractSet[str]] = None
+) -> Iterator[Tuple[str, Union[GrailFileData, IngestionError, None]]]:
+    """
+    Ingest many JSON files, parsing and hashing them in worker processes.
+
+    Results are yielded in input order while later files are still being
+    processed, so the caller can write to the database concurrently. At most
+    PREFETCH_PER_WORKER files per worker are in flight at once, which bounds
+    memory use on very large inputs.
+
+    Args:
+        file_paths: Paths of the JSON files to ingest
+        workers: Number of worker processes (defaults to the CPU count).
+            With one worker, or a sized input of fewer than
+            PARALLEL_MIN_FILES paths, files are ingested in the calling
+            process.
+        known_hashes: Content hashes already stored in the database; files
+            with this content are skipped before parsing
+
+    Yields:
+        (file_path, result) tuples where result is a GrailFileData object,
+        the IngestionError raised for that file, or None for known content
+    """
+    workers = workers or os.cpu_count() or 1
+    if isinstance(file_paths, Sized) and len(file_paths) < PARALLEL_MIN_FILES:
+        workers = 1
+    known_hashes = frozenset(known_hashes or ())
+
+    if workers <= 1:
+        for file_path in file_paths:
+            yield file_path, _ingest_or_error(file_path, known_hashes)
+        return
+
+    max_in_flight = workers * PREFETCH_PER_WORKER
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=_MP_CONTEXT,
+        initializer=_init_worker,
+        initargs=(known_hashes,)
+    ) as executor:
+        in_flight = deque()
+        for file_path in file_paths:
+            in_flight.append((file_path, executor.submit(_ingest_or_error, file_path)))
+            if len(in_flight) >= max_in_flight:
+                done_path, future = in_flight.popleft()
+                yield done_path, future.result()
+
+        while in_flight:
+            done_path, future = in_flight.popleft()
+            yield done_path, future.result()
+
+
 def validate_json_file(file_path: str) -> bool:
     """
     Check if a file is a valid JSON file without full ingestion.
 
+    This parses the whole file; ingest_json_file() validates as it extracts,
+    so don't call both for the same file. For a cheap pre-check use
+    is_json_prefix().
+
     Args:
         file_path: Path to check
 
     Returns:
         True if file exists and contains valid JSON
     """
-    path = Path(file_path)
-
-    if not path.exists() or not path.is_file():
+    if not os.path.isfile(file_path):
         return False
 
     try:
-        with open(path, 'r', encoding='utf-8') as f:
-            json.load(f)
+        with open(file_path, 'rb') as f:
+            _json_loads(f.read())
         return True
     except (json.JSONDecodeError, Exception):
         return False
+
+
+def is_json_prefix(file_path: str, probe_size: int = JSON_PROBE_SIZE) -> bool:
+    """
+    Check whether a file looks like a JSON object or array.
+
+    Only the first probe_size bytes are read: the first non-whitespace byte
+    must be '{' or '['. This rejects obviously broken files without a parse;
+    it does not prove the rest of the file is valid.
+
+    Args:
+        file_path: Path to check
+        probe_size: Number of leading bytes to inspect
+
+    Returns:
+        True if the file starts with a JSON object or array
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            head = f.read(probe_size)
+    except OSError:
+        return False
+
+    return head.lstrip(b' \t\r\n')[:1] in (b'{', b'[')
@@ -3,67 +3,62 @@ Terminal User Interface for interactive file browsing and selection.
 """
 
 import os
+import threading
 from pathlib import Path
-from typing import List, Set
+from typing import Dict, Iterable, List, Optional, Tuple
 
+from textual import work
 from textual.app import App, ComposeResult
 from textual.containers import Container, Vertical
 from textual.widgets import Header, Footer, DirectoryTree, Static, Button
 from textual.binding import Binding
+from textual.worker import get_current_worker
 
 from src.config import DatabaseConfig
 from src.database import GrailDatabase, DatabaseError
-from src.ingestion import ingest_json_file, IngestionError
+from src.ingestion import ingest_json_files, IngestionError
+
+
+# Files per database write; kept below the CLI's batch size so the
+# selection clears and errors surface sooner
+BATCH_SIZE = 200
+
+# Seconds between redraws of queued progress messages (20 Hz)
+STATUS_REFRESH_INTERVAL = 0.05
+
+# Seconds to wait on exit for a cancelled ingest to stop using the connection
+DB_CLOSE_TIMEOUT = 5.0
+
+# Status mark, message suffix and style for each per-file ingest result
+PROGRESS_FORMATS = {
+    'inserted': ("✓", " (new)", "success"),
+    'updated': ("↻", " (updated)", "success"),
+    'duplicate': ("⊘", " (duplicate)", "warning"),
+}
+
+
+def _has_json_suffix(path: str) -> bool:
+    """Check for a .json suffix in any case, lowercasing only the last 5 characters."""
+    return path[-5:].lower() == '.json'
+
+
+class JsonOnlyTree(DirectoryTree):
+    """Directory tree that lists only directories and JSON files."""
+
+    def filter_paths(self, paths: Iterable[Path]) -> Iterable[Path]:
+        """Hide files that can't be selected for ingestion."""
+        # The suffix test is a string check; only non-JSON entries need a stat
+        return [
+            path for path in paths
+            if _has_json_suffix(os.fspath(path)) or path.is_dir()
+        ]
 
 
 class GrailFileBrowser(App):
     """Interactive file browser for selecting and ingesting JSON files."""
 
-    CSS = """
-    Screen {
-        layout: vertical;
-    }
-
-    #info-panel {
-        height: 3;
-        background: $panel;
-        border: solid $primary;
-        padding: 0 1;
-    }
-
-    #tree-container {
-        height: 1fr;
-        border: solid $primary;
-    }
-
-    #button-container {
-        height: 3;
-        layout: horizontal;
-        align: center middle;
-    }
-
-    Button {
-        margin: 0 1;
-    }
-
-    #status {
-        height: auto;
-        background: $panel;
-        padding: 0 1;
-    }
-
-    .success {
-        color: $success;
-    }
-
-    .error {
-        color: $error;
-    }
-
-    .warning {
-        color: $warning;
-    }
-    """
+    # Styles live in a .tcss file next to this module
+    CSS_PATH = "grail_browser.tcss"
 
     BINDINGS = [
         Binding("q", "quit", "Quit"),
@@ -76,9 +71,19 @@ class GrailFileBrowser(App):
         super().__init__()
         self.db_config = db_config
         self.database_name = database_name
-        self.selected_files: Set[Path] = set()
+        # Selected paths mapped to their display names
+        self.selected_files: Dict[str, str] = {}
         self.title = "Save Grail JSON - File Browser"
         self.current_path = Path(os.getcwd())
+        # Latest progress update waiting for the next status redraw, kept
+        # unformatted: (index, total, mark, name, suffix, style)
+        self._pending_status: Optional[Tuple[int, int, str, str, str, str]] = None
+        # Database connection kept open between ingests (see _get_db); the
+        # ingest worker holds _db_lock while it uses it
+        self._db: Optional[GrailDatabase] = None
+        self._db_lock = threading.Lock()
+        # Set while an ingest worker is running
+        self._ingesting = False
 
     def compose(self) -> ComposeResult:
         """Create child widgets."""
@@ -89,7 +94,7 @@ class GrailFileBrowser(App):
                 id="info-panel"
             ),
             Container(
-                DirectoryTree(str(self.current_path), id="file-tree"),
+                JsonOnlyTree(str(self.current_path), id="file-tree"),
                 id="tree-container"
             ),
             Container(
@@ -104,24 +109,61 @@ class GrailFileBrowser(App):
 
     def on_mount(self) -> None:
         """Handle app mount."""
+        # Look the widgets up once instead of walking the DOM per update
+        self._status_widget = self.query_one("#status", Static)
+        self._file_tree = self.query_one("#file-tree", DirectoryTree)
+
         self.update_status()
+        self.set_interval(STATUS_REFRESH_INTERVAL, self._flush_status)
+
+    def on_unmount(self) -> None:
+        """Stop any ingest, then release the database connection when the app exits."""
+        # The worker stops before its next file; wait for it to let go of the
+        # connection so it isn't returned to the pool mid-write. If it can't
+        # finish in time the connection is dropped with the process instead.
+        self.workers.cancel_all()
+        if self._db_lock.acquire(timeout=DB_CLOSE_TIMEOUT):
+            try:
+                self._close_db()
+            finally:
+                self._db_lock.release()
+
+    def _get_db(self) -> GrailDatabase:
+        """
+        Get the app's database connection, connecting on first use.
+
+        Raises:
+            DatabaseError: If the connection cannot be established
+        """
+        if self._db is None:
+            db = GrailDatabase(self.db_config, self.database_name, autocommit=False)
+            db.connect()
+            self._db = db
+        return self._db
+
+    def _close_db(self) -> None:
+        """Close the app's database connection, if open."""
+        if self._db is not None:
+            db, self._db = self._db, None
+            db.close()
 
     def on_directory_tree_file_selected(self, event: DirectoryTree.FileSelected) -> None:
         """Handle file selection in the tree."""
-        file_path = Path(event.path)
+        file_path = str(event.path)
 
         # Only allow JSON files
-        if file_path.suffix.lower() != '.json':
+        if not _has_json_suffix(file_path):
             self.update_status(f"Skipped: Only JSON files can be selected", "warning")
             return
 
         # Toggle selection
+        name = os.path.basename(file_path)
         if file_path in self.selected_files:
-            self.selected_files.remove(file_path)
-            self.update_status(f"Deselected: {file_path.name}")
+            del self.selected_files[file_path]
+            self.update_status(f"Deselected: {name}")
         else:
-            self.selected_files.add(file_path)
-            self.update_status(f"Selected: {file_path.name}")
+            self.selected_files[file_path] = name
+            self.update_status(f"Selected: {name}")
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
@@ -145,8 +187,7 @@ class GrailFileBrowser(App):
 
         # Update the tree path
         try:
-            tree = self.query_one("#file-tree", DirectoryTree)
-            tree.path = str(self.current_path)
+            self._file_tree.path = str(self.current_path)
             self.update_status(f"Up to: {self.current_path}")
 
         except Exception as e:
@@ -158,100 +199,95 @@ class GrailFileBrowser(App):
             self.update_status("No files selected. Navigate and press Space to select JSON files.", "warning")
             return
 
-        files = list(self.selected_files)
+        if self._ingesting:
+            self.update_status("An ingest is already running", "warning")
+            return
+
+        files = dict(self.selected_files)
+        self._ingesting = True
+        self.update_status(f"Ingesting {len(files)} file(s)...", "")
+        self._ingest_files(files)
+
+    @work(thread=True, group="ingest")
+    def _ingest_files(self, files: Dict[str, str]) -> None:
+        """
+        Ingest files on a worker thread so the UI stays responsive.
+
+        Progress goes through queue_progress(); the outcome is drawn on the
+        UI thread by _finish_ingest(). Quitting cancels the worker, which
+        stops before the next file.
+        """
+        worker = get_current_worker()
         total = len(files)
         inserted = 0
         updated = 0
         duplicates = 0
         errors = 0
 
-        self.update_status(f"Ingesting {total} file(s)...", "")
-
-        try:
-            with GrailDatabase(self.db_config, self.database_name) as db:
-                for i, file_path in enumerate(files, 1):
-                    try:
-                        # Ingest the file
-                        file_data = ingest_json_file(str(file_path))
-
-                        # Insert/update in database
-                        result = db.insert_grail_file(
-                            file_path=file_data.file_path,
-                            json_content=file_data.json_content,
-                            content_hash=file_data.content_hash,
-                            ticker=file_data.ticker,
-                            asset_type=file_data.asset_type,
-                            file_created_at=file_data.file_created_at,
-                            file_modified_at=file_data.file_modified_at,
-                            # Core fields
-                            status=file_data.status,
-                            error_message=file_data.error_message,
-                            trade_style=file_data.trade_style,
-                            account_size=file_data.account_size,
-                            risk_percent=file_data.risk_percent,
-                            # Trading decision
-                            should_trade=file_data.should_trade,
-                            trade_action=file_data.trade_action,
-                            trade_confidence_text=file_data.trade_confidence_text,
-                            trade_confidence_pct=file_data.trade_confidence_pct,
-                            no_trade_reason=file_data.no_trade_reason,
-                            # Entry fields
-                            entry_direction=file_data.entry_direction,
-                            entry_price=file_data.entry_price,
-                            entry_recommendation=file_data.entry_recommendation,
-                            # Position sizing
-                            position_quantity=file_data.position_quantity,
-                            position_unit_type=file_data.position_unit_type,
-                            position_size_recommendation=file_data.position_size_recommendation,
-                            position_total_cost_text=file_data.position_total_cost_text,
-                            position_max_risk_text=file_data.position_max_risk_text,
-                            # Market context
-                            market_status=file_data.market_status,
-                            is_tradeable_now=file_data.is_tradeable_now,
-                            in_trial=file_data.in_trial,
-                            # API tracking
-                            runs_remaining=file_data.runs_remaining,
-                            daily_runs_remaining=file_data.daily_runs_remaining,
-                            # Ticker resolution
-                            resolved_ticker=file_data.resolved_ticker,
-                            resolved_ticker_method=file_data.resolved_ticker_method,
-                            # Agent confidence
-                            technical_confidence=file_data.technical_confidence,
-                            macro_confidence=file_data.macro_confidence,
-                            wild_card_risk=file_data.wild_card_risk,
-                            agent_agreement=file_data.agent_agreement,
-                            # Options-specific
-                            option_contract_symbol=file_data.option_contract_symbol,
-                            option_type=file_data.option_type,
-                            option_strike=file_data.option_strike,
-                            option_expiration=file_data.option_expiration,
-                            option_days_to_expiry=file_data.option_days_to_expiry,
-                            option_delta=file_data.option_delta,
-                            option_mid_price=file_data.option_mid_price,
-                            option_volume=file_data.option_volume,
-                            option_open_interest=file_data.option_open_interest
-                        )
-
-                        if result == 'inserted':
-                            inserted += 1
-                            self.update_status(f"[{i}/{total}] ✓ {file_path.name} (new)", "success")
-                        elif result == 'updated':
-                            updated += 1
-                            self.update_status(f"[{i}/{total}] ↻ {file_path.name} (updated)", "success")
-                        elif result == 'duplicate':
-                            duplicates += 1
-                            self.update_status(f"[{i}/{total}] ⊘ {file_path.name} (duplicate)", "warning")
-
-                    except (IngestionError, DatabaseError) as e:
+        def flush(db: GrailDatabase, batch: List):
+            """Write a batch of ingested files and report each result."""
+            nonlocal inserted, updated, duplicates, errors
+
+            results = db.insert_grail_files([file_data for _, _, file_data in batch])
+            for (i, name, _), result in zip(batch, results):
+                if isinstance(result, DatabaseError):
+                    errors += 1
+                    self.queue_progress(i, total, "✗", name, f": {result}", "error")
+                    continue
+
+                if result == 'inserted':
+                    inserted += 1
+                elif result == 'updated':
+                    updated += 1
+                elif result == 'duplicate':
+                    duplicates += 1
+                mark, suffix, style = PROGRESS_FORMATS[result]
+                self.queue_progress(i, total, mark, name, suffix, style)
+
+        error = None
+        with self._db_lock:
+            try:
+                db = self._get_db()
+                # Hashes of stored content let known files be skipped unparsed
+                known_hashes = db.get_content_hashes()
+
+                # Large selections are parsed in worker processes (one per CPU);
+                # results still arrive in selection order
+                batch = []
+                parsed = ingest_json_files(files, known_hashes=known_hashes)
+                for i, (file_path, file_data) in enumerate(parsed, 1):
+                    if worker.is_cancelled:
+                        return
+
+                    name = files[file_path]
+                    if isinstance(file_data, IngestionError):
                         errors += 1
-                        self.update_status(f"[{i}/{total}] ✗ {file_path.name}: {e}", "error")
+                        self.queue_progress(i, total, "✗", name, f": {file_data}", "error")
+                        continue
 
-        except DatabaseError as e:
-            self.update_status(f"Database error: {e}", "error")
-            return
+                    # Database writes are committed once per batch
+                    batch.append((i, name, file_data))
+                    if len(batch) >= BATCH_SIZE:
+                        flush(db, batch)
+                        batch = []
 
-        # Clear selections after ingestion
-        self.selected_files.clear()
+                if batch:
+                    flush(db, batch)
+
+                # Don't leave the kept connection idle inside a transaction
+                db.commit()
+
+            except DatabaseError as e:
+                # Start from a fresh connection on the next ingest
+                self._close_db()
+                error = e
+
+        # A cancelled ingest means the app is exiting; there's nothing to show
+        if worker.is_cancelled:
+            return
+        if error is not None:
+            self.call_from_thread(self._finish_ingest, files, f"Database error: {error}", "error")
+            return
 
         # Final summary
         summary_parts = []
@@ -266,7 +302,38 @@ class GrailFileBrowser(App):
 
         summary = "Complete: " + ", ".join(summary_parts) if summary_parts else "Complete"
         style = "success" if errors == 0 else "warning"
-        self.update_status(summary, style)
+        self.call_from_thread(self._finish_ingest, files, summary, style)
+
+    def _finish_ingest(self, files: Dict[str, str], message: str, style: str) -> None:
+        """Show an ingest's outcome and clear its files from the selection."""
+        self._ingesting = False
+        # Files selected while the ingest ran stay selected
+        if style != "error":
+            for file_path in files:
+                self.selected_files.pop(file_path, None)
+        self._pending_status = None
+        self.update_status(message, style)
+
+    def queue_progress(
+        self, index: int, total: int, mark: str, name: str, suffix: str, style: str
+    ):
+        """
+        Queue a per-file progress update for the status bar.
+
+        Only the latest queued update is drawn, at most every
+        STATUS_REFRESH_INTERVAL seconds, and it is only formatted then, so
+        per-file progress during a large ingest doesn't build or render a
+        status line for every file.
+        """
+        self._pending_status = (index, total, mark, name, suffix, style)
+
+    def _flush_status(self) -> None:
+        """Draw the latest queued progress update, if any."""
+        pending = self._pending_status
+        if pending is not None:
+            self._pending_status = None
+            index, total, mark, name, suffix, style = pending
+            self.update_status(f"[{index}/{total}] {mark} {name}{suffix}", style)
 
     def update_status(self, message: str = None, style: str = ""):
         """Update the status bar."""
@@ -274,7 +341,7 @@ class GrailFileBrowser(App):
             count = len(self.selected_files)
             message = f"Selected: {count} file(s)"
 
-        status = self.query_one("#status", Static)
+        status = self._status_widget
         status.update(message)
 
         # Update style
@@ -18,24 +18,102 @@ To reset to a specific version, use:
     python version_manager.py reset <major> <minor> <patch>
 To check for changes and update the version, use:
     python version_manager.py check
+The first check only records file hashes; to have it bump the version, use:
+    python version_manager.py check --force-initial
 To get the current version, use:
     python version_manager.py status
 """
 
 import os
+import base64
 import json
 import hashlib
 import logging
+import mmap
 import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
-import tomlkit
+# orjson reads and writes the hashes file several times faster than the
+# standard library; it is optional
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2, sort_keys=True).encode('utf-8')
+
+# tomllib (C-accelerated on 3.11+) only reads, which is all most commands
+# need; tomlkit is imported lazily for the format-preserving write
+try:
+    import tomllib
+except ImportError:
+    import tomli as tomllib
+
+# xxHash is much faster than SHA-256 and change detection needs no
+# cryptographic strength; it is optional, so fall back to SHA-256
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Algorithm used for newly recorded file hashes
+HASH_ALGORITHM = 'xxh3_64' if xxhash else 'sha256'
+AVAILABLE_HASH_ALGORITHMS = ('sha256', 'xxh3_64') if xxhash else ('sha256',)
+
+# Text encoding of stored digests; base64 is about two thirds the size of hex.
+# Hash files without an "encoding" key hold hex digests
+HASH_ENCODING = 'base64'
+
+# Algorithm assumed for hash files written before the algorithm was recorded
+LEGACY_HASH_ALGORITHM = 'sha256'
+
+# Files are hashed in chunks of this size rather than read whole
+HASH_CHUNK_SIZE = 64 * 1024
+
+# Files at least this large are memory-mapped and hashed without copying
+MMAP_MIN_SIZE = 1024 * 1024
+
+# Threads used to hash files; file IO and hashing both release the GIL
+HASH_WORKERS = min(32, (os.cpu_count() or 1) * 2)
+
+
+# Matches the __version__ assignment in src/__init__.py
+_VERSION_RE = re.compile(r'__version__\s*=\s*["\'][^"\']*["\']')
+
+# Matches the [project] table's version = "..." line, capturing everything
+# before the quoted value; scoped to that table so [tool.*] versions are left alone
+_PYPROJECT_VERSION_RE = re.compile(
+    r'(?m)^(\[project\][ \t]*\r?\n(?:(?!\[)[^\n]*\n)*?version[ \t]*=[ \t]*)"[^"\n]*"'
+)
+
+# Directories skipped when collecting tracked files (dot-names are skipped too)
+IGNORED_DIRS = frozenset({'dist', 'build', '__pycache__', 'instance', 'node_modules'})
+
+
+def _is_ignored_name(name: str) -> bool:
+    """Return True if a path component should be excluded from tracking"""
+    return name.startswith('.') or name in IGNORED_DIRS
+
+
+def _new_hasher(algorithm: str):
+    """Create a hash object for the named algorithm"""
+    if algorithm == 'xxh3_64' and xxhash:
+        return xxhash.xxh3_64()
+    return hashlib.sha256()
+
 class VersionManager:
     """Manages application versioning based on file hashes"""
 
@@ -48,82 +126,200 @@ class VersionManager:
             'src/**/*.py',
             'pyproject.toml',
         ]
-
-    def _get_file_hash(self, file_path: Path) -> str:
-        """Calculate SHA256 hash of a file"""
+        # Filesystem-derived state memoized for the life of the instance
+        # (one CLI invocation); call refresh() to re-read it
+        self._tracked_files_cache: Optional[List[Path]] = None
+        self._pyproject_data: Optional[Dict[str, Any]] = None
+
+    def refresh(self) -> None:
+        """Forget the cached tracked-file list and parsed pyproject.toml"""
+        self._tracked_files_cache = None
+        self._pyproject_data = None
+
+    def _get_file_hash(self, file_path: Path, algorithm: str = HASH_ALGORITHM) -> str:
+        """Calculate the hash of a file"""
         try:
             with open(file_path, 'rb') as f:
-                return hashlib.sha256(f.read()).hexdigest()
+                hasher = _new_hasher(algorithm)
+                size = os.fstat(f.fileno()).st_size
+                if size > HASH_CHUNK_SIZE and hasattr(os, 'posix_fadvise'):
+                    # Start readahead for the whole file before the first read
+                    # blocks (these are separate advice values, not flags)
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+                if size >= MMAP_MIN_SIZE:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                        hasher.update(mapped)
+                else:
+                    for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+                        hasher.update(chunk)
+                return base64.b64encode(hasher.digest()).decode('ascii')
         except Exception as e:
             logger.warning(f"Could not hash {file_path}: {e}")
             return ""
 
+    def _walk_files(self, root: Path, suffix: str) -> List[Path]:
+        """Recursively collect files under root ending in suffix, pruning ignored directories"""
+        found = []
+        stack = [root]
+        while stack:
+            try:
+                entries = os.scandir(stack.pop())
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    if _is_ignored_name(entry.name):
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False) and entry.name.endswith(suffix):
+                        found.append(Path(entry.path))
+        return found
+
     def _get_all_tracked_files(self) -> List[Path]:
-        """Get all files matching the tracked patterns"""
+        """Get all files matching the tracked patterns (cached until refresh())"""
+        if self._tracked_files_cache is not None:
+            return self._tracked_files_cache
+
         all_files = []
 
         for pattern in self.tracked_files:
-            if '**' in pattern:
-                # Recursive glob
-                files = list(self.project_root.glob(pattern))
-            else:
-                # Simple glob
-                files = list(self.project_root.glob(pattern))
-
-            # Filter out dist/, build/, __pycache__ directories
-            filtered_files = []
-            for f in files:
+            base, sep, name_pattern = pattern.partition('/**/')
+            if sep and name_pattern.startswith('*') and not any(c in name_pattern[1:] for c in '*?['):
+                # Recursive "dir/**/*.ext" pattern: walk with scandir, pruning
+                # ignored directories instead of descending into them
+                all_files.extend(self._walk_files(self.project_root / base, name_pattern[1:]))
+                continue
+
+            # Other patterns: glob, then filter out ignored path parts
+            for f in self.project_root.glob(pattern):
                 if f.is_file():
                     rel_path = f.relative_to(self.project_root)
-                    if not any(part.startswith('.') or part in ['dist', 'build', '__pycache__', 'instance']
-                             for part in rel_path.parts):
-                        filtered_files.append(f)
+                    if not any(_is_ignored_name(part) for part in rel_path.parts):
+                        all_files.append(f)
+
+        self._tracked_files_cache = sorted(set(all_files))
+        return self._tracked_files_cache
+
+    def _calculate_file_hashes(self, algorithm: str = HASH_ALGORITHM,
+                               cached: Optional[Dict[str, Dict[str, Any]]] = None) -> Dict[str, Dict[str, Any]]:
+        """Calculate hashes for all tracked files
 
-            all_files.extend(filtered_files)
+        Each entry records the file's hash ("h") with its size ("s") and
+        mtime_ns ("m"). Files whose size and mtime match their entry in
+        ``cached`` reuse the cached hash without being opened.
 
-        return sorted(set(all_files))
+        Args:
+            algorithm: Hash algorithm to use for files that need hashing
+            cached: Previous entries made with ``algorithm``, keyed by relative path
 
-    def _calculate_file_hashes(self) -> Dict[str, str]:
-        """Calculate hashes for all tracked files"""
+        Returns:
+            Dict mapping relative path to its {"h", "s", "m"} entry
+        """
+        cached = cached or {}
         hashes = {}
+        stale = []
         tracked_files = self._get_all_tracked_files()
 
         for file_path in tracked_files:
             rel_path = str(file_path.relative_to(self.project_root))
-            hashes[rel_path] = self._get_file_hash(file_path)
+            try:
+                st = os.stat(file_path)
+            except OSError as e:
+                logger.warning(f"Could not stat {file_path}: {e}")
+                hashes[rel_path] = {'h': ""}
+                continue
+
+            previous = cached.get(rel_path)
+            if previous and previous.get('s') == st.st_size and previous.get('m') == st.st_mtime_ns:
+                hashes[rel_path] = {'h': previous['h'], 's': st.st_size, 'm': st.st_mtime_ns}
+            else:
+                hashes[rel_path] = {'h': "", 's': st.st_size, 'm': st.st_mtime_ns}
+                stale.append(((st.st_dev, st.st_ino), rel_path, file_path))
+
+        # Read in on-disk (device, inode) order for mostly sequential IO;
+        # entries stay keyed and ordered by relative path
+        stale.sort(key=lambda item: item[0])
+
+        if len(stale) > 1:
+            with ThreadPoolExecutor(max_workers=min(HASH_WORKERS, len(stale))) as executor:
+                file_hashes = executor.map(lambda item: self._get_file_hash(item[2], algorithm), stale)
+                for (_, rel_path, _), file_hash in zip(stale, file_hashes):
+                    hashes[rel_path]['h'] = file_hash
+        else:
+            for _, rel_path, file_path in stale:
+                hashes[rel_path]['h'] = self._get_file_hash(file_path, algorithm)
 
         return hashes
 
-    def _load_file_hashes(self) -> Dict[str, str]:
-        """Load file hashes from .version_hashes.json"""
+    def _load_file_hashes(self) -> Tuple[str, Dict[str, Dict[str, Any]]]:
+        """Load file hash entries and the algorithm that produced them from .version_hashes.json"""
         if not self.hashes_file.exists():
-            return {}
+            return HASH_ALGORITHM, {}
 
         try:
-            with open(self.hashes_file, 'r') as f:
-                return json.load(f)
+            with open(self.hashes_file, 'rb') as f:
+                data = _json_loads(f.read())
         except Exception as e:
             logger.error(f"Error loading hashes file: {e}")
-            return {}
+            return HASH_ALGORITHM, {}
 
-    def _save_file_hashes(self, hashes: Dict[str, str]) -> None:
-        """Save file hashes to .version_hashes.json"""
+        # Older files are a flat {path: sha256} mapping
+        if 'files' not in data:
+            algorithm, encoding, files = LEGACY_HASH_ALGORITHM, 'hex', data
+        else:
+            algorithm = data.get('algo', LEGACY_HASH_ALGORITHM)
+            encoding, files = data.get('encoding', 'hex'), data['files']
+
+        # Bare hash strings predate the stat cache; without a size and mtime
+        # they are always rehashed
+        entries = {path: entry if isinstance(entry, dict) else {'h': entry}
+                   for path, entry in files.items()}
+
+        # Hex digests convert to base64 exactly, so no file needs rehashing
+        if encoding == 'hex':
+            try:
+                for entry in entries.values():
+                    entry['h'] = base64.b64encode(bytes.fromhex(entry['h'])).decode('ascii')
+            except (ValueError, TypeError, KeyError) as e:
+                logger.error(f"Error converting hex hashes: {e}")
+                return HASH_ALGORITHM, {}
+
+        return algorithm, entries
+
+    def _save_file_hashes(self, hashes: Dict[str, Dict[str, Any]], algorithm: str = HASH_ALGORITHM) -> None:
+        """Save file hash entries and the algorithm that produced them to .version_hashes.json"""
         try:
-            with open(self.hashes_file, 'w') as f:
-                json.dump(hashes, f, indent=2)
+            with open(self.hashes_file, 'wb') as f:
+                f.write(_json_dumps({'algo': algorithm, 'encoding': HASH_ENCODING, 'files': hashes}))
         except Exception as e:
             logger.error(f"Error saving hashes file: {e}")
 
-    def _read_version_from_pyproject(self) -> Tuple[int, int, int]:
-        """Read version from pyproject.toml"""
+    def _load_pyproject(self) -> Optional[Dict[str, Any]]:
+        """Parse pyproject.toml (cached until refresh()), returning None if it is missing or unreadable"""
+        if self._pyproject_data is not None:
+            return self._pyproject_data
+
         if not self.pyproject_path.exists():
             logger.error(f"pyproject.toml not found at {self.pyproject_path}")
-            return (0, 1, 0)
+            return None
 
         try:
-            with open(self.pyproject_path, 'r') as f:
-                pyproject = tomlkit.load(f)
+            with open(self.pyproject_path, 'rb') as f:
+                self._pyproject_data = tomllib.load(f)
+            return self._pyproject_data
+        except Exception as e:
+            logger.error(f"Error reading version from pyproject.toml: {e}")
+            return None
 
+    def _read_version_from_pyproject(self) -> Tuple[int, int, int]:
+        """Read version from pyproject.toml"""
+        pyproject = self._load_pyproject()
+        if pyproject is None:
+            return (0, 1, 0)
+
+        try:
             version_str = pyproject.get('project', {}).get('version', '0.1.0')
             # Parse version string like "0.1.0" into (0, 1, 0)
             parts = version_str.split('.')
@@ -137,10 +333,25 @@ class VersionManager:
             return (0, 1, 0)
 
     def _write_version_to_pyproject(self, major: int, minor: int, patch: int) -> None:
-        """Write version to pyproject.toml"""
+        """Write version to pyproject.toml, preserving its formatting"""
         try:
             with open(self.pyproject_path, 'r') as f:
-                pyproject = tomlkit.load(f)
+                content = f.read()
+
+            # Fast path: rewrite the version string in place
+            content, replaced = _PYPROJECT_VERSION_RE.subn(
+                rf'\g<1>"{major}.{minor}.{patch}"', content, count=1
+            )
+            if replaced:
+                with open(self.pyproject_path, 'w') as f:
+                    f.write(content)
+                self._pyproject_data = None
+                return
+
+            # Unusual layout (or no version yet): round-trip through tomlkit
+            import tomlkit
+
+            pyproject = tomlkit.parse(content)
 
             # Update version in project section
             if 'project' not in pyproject:
@@ -149,6 +360,7 @@ class VersionManager:
 
             with open(self.pyproject_path, 'w') as f:
                 tomlkit.dump(pyproject, f)
+            self._pyproject_data = None
 
         except Exception as e:
             logger.error(f"Error writing version to pyproject.toml: {e}")
@@ -165,18 +377,16 @@ class VersionManager:
                 content = f'"""\nsave-grail-json: A tool to save grail JSON docs to a database for later review and analysis\n"""\n\n__version__ = {version_str}\n'
                 with open(self.init_path, 'w') as f:
                     f.write(content)
+                # A new tracked file exists now
+                self._tracked_files_cache = None
             else:
                 # Update existing file
                 with open(self.init_path, 'r') as f:
                     content = f.read()
 
                 # Replace __version__ = "..." with new version
-                pattern = r'__version__\s*=\s*["\'][^"\']*["\']'
-                replacement = f'__version__ = {version_str}'
-
-                if re.search(pattern, content):
-                    content = re.sub(pattern, replacement, content)
-                else:
+                content, replaced = _VERSION_RE.subn(f'__version__ = {version_str}', content)
+                if not replaced:
                     # Add __version__ if it doesn't exist
                     content += f'\n__version__ = {version_str}\n'
 
@@ -187,24 +397,110 @@ class VersionManager:
             logger.error(f"Error writing version to src/__init__.py: {e}")
             raise
 
+    def _set_version(self, major: int, minor: int, patch: int,
+                     hashes: Optional[Dict[str, Dict[str, Any]]] = None) -> Dict[str, Dict[str, Any]]:
+        """Write the version to pyproject.toml and src/__init__.py and re-record file hashes
+
+        Args:
+            major: Major version number
+            minor: Minor version number
+            patch: Patch version number
+            hashes: Up-to-date HASH_ALGORITHM entries (e.g. from check_and_update_version)
+                to reuse instead of the recorded ones
+
+        Returns:
+            The file hash entries that were saved
+        """
+        self._write_version_to_pyproject(major, minor, patch)
+        self._write_version_to_init_py(major, minor, patch)
+
+        if hashes is None:
+            previous_algorithm, hashes = self._load_file_hashes()
+            if previous_algorithm != HASH_ALGORITHM:
+                hashes = {}
+
+        # The version files were just rewritten, possibly within the same
+        # mtime tick and at the same size, so never trust their cached entries;
+        # everything else is rehashed only if its stat changed
+        cached = dict(hashes)
+        for written in (self.pyproject_path, self.init_path):
+            cached.pop(str(written.relative_to(self.project_root)), None)
+
+        hashes = self._calculate_file_hashes(HASH_ALGORITHM, cached)
+        self._save_file_hashes(hashes)
+        return hashes
+
+    def _bump(self, kind: str, hashes: Optional[Dict[str, Dict[str, Any]]] = None) -> Tuple[int, int, int]:
+        """Increment the 'major', 'minor' or 'patch' component, resetting the ones below it"""
+        major, minor, patch = self._read_version_from_pyproject()
+
+        if kind == 'major':
+            major, minor, patch = major + 1, 0, 0
+        elif kind == 'minor':
+            minor, patch = minor + 1, 0
+        else:
+            patch += 1
+
+        self._set_version(major, minor, patch, hashes)
+        return major, minor, patch
+
     def get_current_version(self) -> Tuple[int, int, int]:
         """Get current version without checking for changes"""
         return self._read_version_from_pyproject()
 
-    def check_and_update_version(self) -> Tuple[int, int, int, bool]:
-        """Check for file changes and update version if needed"""
+    def check_and_update_version(self, force_initial: bool = False) -> Tuple[int, int, int, bool, Dict[str, Dict[str, Any]]]:
+        """Check for file changes and update version if needed
+
+        Args:
+            force_initial: When no hashes have been recorded yet, count every
+                tracked file as added and bump the version. By default the
+                first run only records the hashes.
+
+        Returns:
+            (major, minor, patch, changed, hashes) where hashes are the current
+            file hash entries, which can be passed to the increment_*_version
+            and reset_version methods to avoid hashing again
+        """
         major, minor, patch = self._read_version_from_pyproject()
-        current_hashes = self._calculate_file_hashes()
-        previous_hashes = self._load_file_hashes()
+        previous_algorithm, previous_hashes = self._load_file_hashes()
+
+        # First run: there is nothing to compare against, so just record
+        if not previous_hashes and not force_initial:
+            current_hashes = self._calculate_file_hashes()
+            self._save_file_hashes(current_hashes)
+            logger.info("Recorded initial file hashes")
+            return major, minor, patch, False, current_hashes
+
+        # Compare using the algorithm the stored hashes were made with, so
+        # switching algorithms doesn't look like every file changed. Hashes
+        # from an algorithm that isn't installed here can't be reproduced;
+        # then hash with the local algorithm and judge changes by each
+        # entry's recorded size and mtime instead
+        reproducible = previous_algorithm in AVAILABLE_HASH_ALGORITHMS
+        if reproducible:
+            current_hashes = self._calculate_file_hashes(previous_algorithm, previous_hashes)
+        else:
+            logger.info(
+                f"Recorded hashes use {previous_algorithm}, which isn't available; "
+                f"comparing file sizes and modification times instead"
+            )
+            current_hashes = self._calculate_file_hashes()
 
         # Check if any files have changed
         files_changed = False
         changed_files = []
 
         # Check for modified files
-        for file_path, current_hash in current_hashes.items():
+        for file_path, current_entry in current_hashes.items():
             if file_path in previous_hashes:
-                if previous_hashes[file_path] != current_hash:
+                previous_entry = previous_hashes[file_path]
+                if reproducible:
+                    modified = previous_entry['h'] != current_entry['h']
+                else:
+                    modified = (previous_entry.get('s'), previous_entry.get('m')) != (
+                        current_entry.get('s'), current_entry.get('m')
+                    )
+                if modified:
                     files_changed = True
                     changed_files.append(f"Modified: {file_path}")
             else:
@@ -220,89 +516,156 @@ class VersionManager:
         if files_changed:
             # Increment patch version for file changes
             patch += 1
-            self._write_version_to_pyproject(major, minor, patch)
-            self._write_version_to_init_py(major, minor, patch)
-            self._save_file_hashes(current_hashes)
+            current_hashes = self._set_version(
+                major, minor, patch,
+                current_hashes if not reproducible or previous_algorithm == HASH_ALGORITHM else None
+            )
 
             logger.info(f"Version updated to {major}.{minor}.{patch}")
             for change in changed_files:
                 logger.info(f"  {change}")
 
-        return major, minor, patch, files_changed
+        elif not reproducible:
+            # Nothing changed; re-record the hashes with the local algorithm
+            self._save_file_hashes(current_hashes)
 
-    def increment_major_version(self) -> Tuple[int, int, int]:
-        """Manually increment major version and reset minor/patch to 0"""
-        major, minor, patch = self._read_version_from_pyproject()
-        major += 1
-        minor = 0
-        patch = 0
+        elif previous_algorithm != HASH_ALGORITHM:
+            # Nothing changed; re-record the hashes with the current algorithm
+            current_hashes = self._calculate_file_hashes()
+            self._save_file_hashes(current_hashes)
 
-        self._write_version_to_pyproject(major, minor, patch)
-        self._write_version_to_init_py(major, minor, patch)
-        self._save_file_hashes(self._calculate_file_hashes())
+        elif current_hashes != previous_hashes:
+            # Content is the same but sizes/mtimes moved (or were never
+            # recorded); refresh the stat cache so the next check can skip them
+            self._save_file_hashes(current_hashes, previous_algorithm)
+
+        return major, minor, patch, files_changed, current_hashes
+
+    def increment_major_version(self, hashes: Optional[Dict[str, Dict[str, Any]]] = None) -> Tuple[int, int, int]:
+        """Manually increment major version and reset minor/patch to 0"""
+        major, minor, patch = self._bump('major', hashes)
 
         logger.info(f"Major version incremented to {major}.{minor}.{patch}")
         return major, minor, patch
 
-    def increment_minor_version(self) -> Tuple[int, int, int]:
+    def increment_minor_version(self, hashes: Optional[Dict[str, Dict[str, Any]]] = None) -> Tuple[int, int, int]:
         """Manually increment minor version and reset patch to 0"""
-        major, minor, patch = self._read_version_from_pyproject()
-        minor += 1
-        patch = 0
-
-        self._write_version_to_pyproject(major, minor, patch)
-        self._write_version_to_init_py(major, minor, patch)
-        self._save_file_hashes(self._calculate_file_hashes())
+        major, minor, patch = self._bump('minor', hashes)
 
         logger.info(f"Minor version incremented to {major}.{minor}.{patch}")
         return major, minor, patch
 
-    def increment_patch_version(self) -> Tuple[int, int, int]:
+    def increment_patch_version(self, hashes: Optional[Dict[str, Dict[str, Any]]] = None) -> Tuple[int, int, int]:
         """Manually increment patch version"""
-        major, minor, patch = self._read_version_from_pyproject()
-        patch += 1
-
-        self._write_version_to_pyproject(major, minor, patch)
-        self._write_version_to_init_py(major, minor, patch)
-        self._save_file_hashes(self._calculate_file_hashes())
+        major, minor, patch = self._bump('patch', hashes)
 
         logger.info(f"Patch version incremented to {major}.{minor}.{patch}")
         return major, minor, patch
 
     def get_version_string(self) -> str:
-        """Get formatted version string"""
-        major, minor, patch, _ = self.check_and_update_version()
+        """Get formatted version string without checking for changes"""
+        major, minor, patch = self.get_current_version()
+        return f"v{major}.{minor}.{patch}"
+
+    def get_version_string_checked(self) -> str:
+        """Check for file changes, bumping the version if needed, then get formatted version string"""
+        major, minor, patch, _, _ = self.check_and_update_version()
         return f"v{major}.{minor}.{patch}"
 
-    def reset_version(self, major: int = 1, minor: int = 0, patch: int = 0) -> Tuple[int, int, int]:
+    def reset_version(self, major: int = 1, minor: int = 0, patch: int = 0,
+                      hashes: Optional[Dict[str, Dict[str, Any]]] = None) -> Tuple[int, int, int]:
         """Reset version to specified values"""
-        self._write_version_to_pyproject(major, minor, patch)
-        self._write_version_to_init_py(major, minor, patch)
-        self._save_file_hashes(self._calculate_file_hashes())
+        self._set_version(major, minor, patch, hashes)
 
         logger.info(f"Version reset to {major}.{minor}.{patch}")
         return major, minor, patch
 
-# Global version manager instance
-version_manager = VersionManager()
+# Default VersionManager, created on first use so importing this module
+# doesn't touch the filesystem
+_default_manager: Optional[VersionManager] = None
+
+
+def _get_default() -> VersionManager:
+    """Return the default VersionManager, creating it on first use"""
+    global _default_manager
+    if _default_manager is None:
+        _default_manager = VersionManager()
+    return _default_manager
+
+
+def __getattr__(name: str) -> Any:
+    # Keep the old module-level ``version_manager`` instance available, lazily
+    if name == 'version_manager':
+        return _get_default()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def get_version_string() -> str:
     """Convenience function to get version string"""
-    return version_manager.get_version_string()
+    return _get_default().get_version_string()
+
+def get_version_string_checked() -> str:
+    """Convenience function to check for changes and get version string"""
+    return _get_default().get_version_string_checked()
 
 def increment_major() -> str:
     """Convenience function to increment major version"""
-    major, minor, patch = version_manager.increment_major_version()
+    major, minor, patch = _get_default().increment_major_version()
     return f"v{major}.{minor}.{patch}"
 
+# CLI command handlers; each takes the arguments after the command name
+def _cmd_status(args: List[str]) -> None:
+    major, minor, patch = _get_default().get_current_version()
+    print(f"Current version: v{major}.{minor}.{patch}")
+
+def _cmd_check(args: List[str]) -> None:
+    force_initial = '--force-initial' in args
+    major, minor, patch, changed, _ = _get_default().check_and_update_version(force_initial)
+    if changed:
+        print(f"Version updated to v{major}.{minor}.{patch}")
+    else:
+        print(f"No changes detected. Version remains v{major}.{minor}.{patch}")
+
+def _cmd_major(args: List[str]) -> None:
+    major, minor, patch = _get_default().increment_major_version()
+    print(f"Major version incremented to v{major}.{minor}.{patch}")
+
+def _cmd_minor(args: List[str]) -> None:
+    major, minor, patch = _get_default().increment_minor_version()
+    print(f"Minor version incremented to v{major}.{minor}.{patch}")
+
+def _cmd_patch(args: List[str]) -> None:
+    major, minor, patch = _get_default().increment_patch_version()
+    print(f"Patch version incremented to v{major}.{minor}.{patch}")
+
+def _cmd_reset(args: List[str]) -> None:
+    if len(args) == 3:
+        try:
+            major, minor, patch = (int(arg) for arg in args)
+        except ValueError:
+            print("Error: Major, minor, and patch versions must be integers")
+            sys.exit(1)
+        major, minor, patch = _get_default().reset_version(major, minor, patch)
+    else:
+        major, minor, patch = _get_default().reset_version()
+    print(f"Version reset to v{major}.{minor}.{patch}")
+
+COMMANDS = {
+    'status': _cmd_status,
+    'check': _cmd_check,
+    'major': _cmd_major,
+    'minor': _cmd_minor,
+    'patch': _cmd_patch,
+    'reset': _cmd_reset,
+}
+
 # CLI interface
 if __name__ == '__main__':
-    import sys
-
     if len(sys.argv) < 2:
         print("Version Manager Commands:")
         print("  python version_manager.py status      - Show current version")
         print("  python version_manager.py check       - Check for changes and update")
+        print("  python version_manager.py check --force-initial")
+        print("                                        - Also bump when no hashes are recorded yet")
         print("  python version_manager.py major       - Increment major version")
         print("  python version_manager.py minor       - Increment minor version")
         print("  python version_manager.py patch       - Increment patch version")
@@ -311,45 +674,8 @@ if __name__ == '__main__':
         sys.exit(1)
 
     command = sys.argv[1].lower()
-
-    if command == 'status':
-        major, minor, patch = version_manager.get_current_version()
-        print(f"Current version: v{major}.{minor}.{patch}")
-
-    elif command == 'check':
-        major, minor, patch, changed = version_manager.check_and_update_version()
-        if changed:
-            print(f"Version updated to v{major}.{minor}.{patch}")
-        else:
-            print(f"No changes detected. Version remains v{major}.{minor}.{patch}")
-
-    elif command == 'major':
-        major, minor, patch = version_manager.increment_major_version()
-        print(f"Major version incremented to v{major}.{minor}.{patch}")
-
-    elif command == 'minor':
-        major, minor, patch = version_manager.increment_minor_version()
-        print(f"Minor version incremented to v{major}.{minor}.{patch}")
-
-    elif command == 'patch':
-        major, minor, patch = version_manager.increment_patch_version()
-        print(f"Patch version incremented to v{major}.{minor}.{patch}")
-
-    elif command == 'reset':
-        if len(sys.argv) == 5:
-            try:
-                major = int(sys.argv[2])
-                minor = int(sys.argv[3])
-                patch = int(sys.argv[4])
-                major, minor, patch = version_manager.reset_version(major, minor, patch)
-                print(f"Version reset to v{major}.{minor}.{patch}")
-            except ValueError:
-                print("Error: Major, minor, and patch versions must be integers")
-                sys.exit(1)
-        else:
-            major, minor, patch = version_manager.reset_version()
-            print(f"Version reset to v{major}.{minor}.{patch}")
-
-    else:
+    handler = COMMANDS.get(command)
+    if handler is None:
         print(f"Unknown command: {command}")
         sys.exit(1)
+    handler(sys.argv[2:])